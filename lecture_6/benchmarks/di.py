@@ -0,0 +1,48 @@
+import argparse
+import time
+
+from book_api.application.use_cases import (
+    CreateBookUseCase,
+    DeleteBookUseCase,
+    GetBookListUseCase,
+    GetBookUseCase,
+    UpdateBookUseCase,
+)
+from book_api.core.container import init_container
+from book_api.gateways.sqlite.database import Database
+
+REQUEST_USE_CASES = (
+    GetBookListUseCase,
+    GetBookUseCase,
+    CreateBookUseCase,
+    UpdateBookUseCase,
+    DeleteBookUseCase,
+)
+
+
+def measure(preresolve_graph: bool, iterations: int) -> float:
+    container = init_container(preresolve_graph=preresolve_graph)
+    try:
+        started = time.perf_counter()
+        for index in range(iterations):
+            container.resolve(REQUEST_USE_CASES[index % len(REQUEST_USE_CASES)])
+        return (time.perf_counter() - started) / iterations
+    finally:
+        container.resolve(Database).close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-request dependency resolution overhead."
+    )
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    for preresolve_graph in (False, True):
+        seconds = measure(preresolve_graph, args.iterations)
+        mode = "preresolved" if preresolve_graph else "per-request"
+        print(f"{mode:>12}: {seconds * 1e6:.2f} us/resolve")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import sqlite3
+import time
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.models import BookORM
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / ".fixtures"
+
+WORDS = (
+    "river",
+    "shadow",
+    "garden",
+    "winter",
+    "empire",
+    "silent",
+    "glass",
+    "storm",
+    "orchard",
+    "harbor",
+    "lantern",
+    "meadow",
+    "ember",
+    "canyon",
+    "violet",
+    "iron",
+    "hollow",
+    "thunder",
+    "willow",
+    "marble",
+    "falcon",
+    "crimson",
+    "summit",
+    "ocean",
+    "velvet",
+    "granite",
+    "whisper",
+    "amber",
+    "frost",
+    "valley",
+    "copper",
+    "raven",
+    "prairie",
+    "cinder",
+    "tide",
+    "autumn",
+    "beacon",
+    "cobalt",
+    "delta",
+    "echo",
+    "forest",
+    "gale",
+    "haven",
+    "island",
+    "jasper",
+    "kestrel",
+    "lagoon",
+    "mirror",
+    "north",
+    "onyx",
+    "pine",
+    "quarry",
+    "ridge",
+    "sable",
+    "tundra",
+    "umber",
+    "vale",
+    "wren",
+    "yarrow",
+    "zephyr",
+    "atlas",
+)
+AUTHORS = 5_000
+SEED_CHUNK_SIZE = 100_000
+
+
+def book_row(index: int) -> tuple[str, str, int]:
+    title = f"{WORDS[index % 61].title()} {WORDS[(index // 61) % 59]} {index}"
+    return title, f"Author {index % AUTHORS}", 1900 + (index * 7) % 125
+
+
+def book_rows(rows: int) -> Iterator[tuple[str, str, int]]:
+    return (book_row(index) for index in range(rows))
+
+
+def seed_file(path: Path, rows: int) -> None:
+    table = BookORM.__table__
+    dialect = sqlite.dialect()
+
+    # A throwaway file needs no durability while it is filled. Compiling the DDL directly skips the
+    # table's after_create listener, so the search index and its triggers do not exist during the
+    # load, and the secondary indexes are built once at the end.
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=OFF")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.execute(str(CreateTable(table).compile(dialect=dialect)))
+    rows_iter = book_rows(rows)
+    with connection:
+        while chunk := list(islice(rows_iter, SEED_CHUNK_SIZE)):
+            connection.executemany(
+                "INSERT INTO books (title, author, year) VALUES (?, ?, ?)", chunk
+            )
+    for index in table.indexes:
+        connection.execute(str(CreateIndex(index).compile(dialect=dialect)))
+    connection.close()
+
+    # The search index and its triggers are created, and the index rebuilt once, the way the app does it.
+    database = Database(
+        url=f"sqlite:///{path}", read_only_pool=False, slow_query_threshold=0
+    )
+    database.create_tables()
+    database.close()
+
+
+def dataset(rows: int, fixtures_dir: Path = DEFAULT_FIXTURES_DIR) -> Path:
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    path = fixtures_dir / f"books-{rows}.db"
+    if path.exists():
+        return path
+
+    partial = path.with_suffix(".partial")
+    partial.unlink(missing_ok=True)
+    started = time.perf_counter()
+    print(f"seeding {rows:,} rows into {path} ...", flush=True)
+    seed_file(partial, rows)
+    partial.rename(path)
+    print(f"seeded {rows:,} rows in {time.perf_counter() - started:.1f}s", flush=True)
+    return path
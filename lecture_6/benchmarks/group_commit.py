@@ -0,0 +1,91 @@
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from book_api.core.configs import settings
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.group_commit import (
+    GroupCommitBookRepository,
+    GroupCommitWriter,
+)
+from book_api.gateways.sqlite.repositories import IBookRepository, SQLiteBookRepository
+
+
+def throughput(repository: IBookRepository, concurrency: int, writes: int) -> float:
+    def write(index: int) -> None:
+        repository.create(
+            title=f"Title {index}", author=f"Author {index % 97}", year=2000
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        list(pool.map(write, range(writes)))
+        return writes / (time.perf_counter() - started)
+
+
+def measure(
+    grouped: bool,
+    concurrency: int,
+    writes: int,
+    pragmas: dict[str, str | int],
+    max_delay: float,
+) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        # Plain writers contend for the lock, so they get a writer pool as wide as the load.
+        database = Database(
+            url=f"sqlite:///{Path(directory) / 'bench.db'}",
+            pragmas=pragmas,
+            read_only_pool=False,
+            slow_query_threshold=0,
+        )
+        database.create_tables()
+        generation = WriteGeneration()
+        writer = GroupCommitWriter(
+            database=database, generation=generation, max_delay=max_delay
+        )
+        repository = (
+            GroupCommitBookRepository(
+                database=database, generation=generation, writer=writer
+            )
+            if grouped
+            else SQLiteBookRepository(database=database, generation=generation)
+        )
+        try:
+            return throughput(repository, concurrency, writes)
+        finally:
+            writer.close()
+            database.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Write throughput with and without group commit."
+    )
+    parser.add_argument("--writes", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument(
+        "--synchronous", default="FULL", help="FULL makes every commit pay an fsync"
+    )
+    parser.add_argument(
+        "--max-delay-ms", type=float, default=settings.SQLITE_GROUP_COMMIT_MAX_DELAY_MS
+    )
+    args = parser.parse_args(argv)
+
+    pragmas = {**settings.sqlite_pragmas, "synchronous": args.synchronous}
+    for concurrency in args.concurrency:
+        plain = measure(
+            False, concurrency, args.writes, pragmas, args.max_delay_ms / 1000
+        )
+        grouped = measure(
+            True, concurrency, args.writes, pragmas, args.max_delay_ms / 1000
+        )
+        print(
+            f"concurrency {concurrency:>3}: plain {plain:8,.0f} writes/s, grouped {grouped:8,.0f} writes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from book_api.application.services.cached import BookCache
+from book_api.domain.entities import Book
+from book_api.gateways.sqlite.models import book_from_row
+
+
+@dataclass
+class DictBook:
+    id: int
+    title: str
+    author: str
+    year: int | None
+
+
+def dict_book_from_row(row: tuple) -> DictBook:
+    return DictBook(id=row[0], title=row[1], author=row[2], year=row[3])
+
+
+def interned_dict_book_from_row(row: tuple) -> DictBook:
+    return DictBook(id=row[0], title=row[1], author=sys.intern(row[2]), year=row[3])
+
+
+def slotted_book_from_row(row: tuple) -> Book:
+    return Book(id=row[0], title=row[1], author=row[2], year=row[3])
+
+
+# Slots and author interning are measured on their own and together, so neither saving is
+# credited to the other.
+VARIANTS = (
+    ("dict", dict_book_from_row),
+    ("dict + intern", interned_dict_book_from_row),
+    ("slotted", slotted_book_from_row),
+    ("slotted + intern", book_from_row),
+)
+
+
+def rows(count: int, authors: int) -> Iterator[tuple]:
+    # Fresh strings per row, like values decoded from a sqlite cursor.
+    for index in range(count):
+        yield index, f"Title {index}", f"Author {index % authors}", 1900 + index % 120
+
+
+def bytes_per_book(build: Callable[[tuple], object], count: int, authors: int) -> float:
+    cache = BookCache(max_size=count, ttl=3600.0)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for row in rows(count, authors):
+        cache.set(row[0], build(row))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bytes retained per cached Book.")
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--authors", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    for name, build in VARIANTS:
+        print(
+            f"{name:>16}: {bytes_per_book(build, args.books, args.authors):.0f} bytes/book"
+        )
+
+
+if __name__ == "__main__":
+    main()
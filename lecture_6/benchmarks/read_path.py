@@ -0,0 +1,72 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, select
+
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.models import BookORM
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+
+
+def seed(database: Database, rows: int) -> None:
+    with database.connection as session:
+        session.execute(
+            insert(BookORM),
+            [
+                {
+                    "title": f"Title {index}",
+                    "author": f"Author {index % 997}",
+                    "year": 1900 + index % 120,
+                }
+                for index in range(rows)
+            ],
+        )
+        session.commit()
+
+
+def orm_page(repository: SQLiteBookRepository, limit: int) -> int:
+    with repository.session as session:
+        books = session.scalars(select(BookORM).order_by(BookORM.id).limit(limit)).all()
+        return len([book.to_entity() for book in books])
+
+
+def row_page(repository: SQLiteBookRepository, limit: int) -> int:
+    return len(
+        repository.find_many(title=None, author=None, year=None, offset=0, limit=limit)
+    )
+
+
+def measure(read, repository: SQLiteBookRepository, limit: int, rounds: int) -> float:
+    started = time.perf_counter()
+    fetched = sum(read(repository, limit) for _ in range(rounds))
+    return fetched / (time.perf_counter() - started)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Rows per second of the ORM and row-mapped read paths."
+    )
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(
+            url=f"sqlite:///{Path(directory) / 'bench.db'}", slow_query_threshold=0
+        )
+        database.create_tables()
+        seed(database, args.rows)
+        repository = SQLiteBookRepository(database=database)
+        try:
+            for name, read in (("orm", orm_page), ("rows", row_page)):
+                rate = measure(read, repository, args.limit, args.rounds)
+                print(f"{name:>5}: {rate:,.0f} rows/s")
+        finally:
+            database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+import argparse
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import combinations
+from pathlib import Path
+
+from benchmarks.fixtures import AUTHORS, DEFAULT_FIXTURES_DIR, WORDS, dataset
+from book_api.application.commands import (
+    GetBookCommand,
+    GetBookListCommand,
+    PaginationQuery,
+)
+from book_api.application.services.book import BookService
+from book_api.application.use_cases import GetBookListUseCase, GetBookUseCase
+from book_api.gateways.sqlite.caching import CountCache
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+FILTERS = ("title", "author", "year", "text")
+FILTER_VALUES = {
+    "title": "orchard",
+    "author": "Author 42",
+    "year": 1950,
+    "text": "river",
+}
+PAGE_SIZE = 20
+
+Case = Callable[[int], object]
+
+
+@dataclass
+class Timing:
+    runs: int
+    median_us: float
+    mean_us: float
+    min_us: float
+    p95_us: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "Timing":
+        ordered = sorted(samples)
+        return cls(
+            runs=len(ordered),
+            median_us=statistics.median(ordered),
+            mean_us=statistics.fmean(ordered),
+            min_us=ordered[0],
+            p95_us=ordered[min(len(ordered) - 1, round(len(ordered) * 0.95))],
+        )
+
+
+def filter_combinations() -> list[tuple[str, ...]]:
+    return [
+        combo
+        for size in range(len(FILTERS) + 1)
+        for combo in combinations(FILTERS, size)
+    ]
+
+
+def read_cases(
+    repository: SQLiteBookRepository, rows: int, rng: random.Random
+) -> dict[str, Case]:
+    service = BookService(repository=repository)
+    get_book = GetBookUseCase(book_service=service)
+    get_book_list = GetBookListUseCase(book_service=service)
+    no_filters = {"title": None, "author": None, "year": None}
+    deep_offset = max(rows - rows // 10 - PAGE_SIZE, 0)
+    ids = [rng.randint(1, rows) for _ in range(1024)]
+
+    cases: dict[str, Case] = {
+        "repository.get_by_id": lambda run: repository.get_by_id(ids[run % len(ids)]),
+        "repository.find_many.first_page": lambda run: repository.find_many(
+            **no_filters, offset=0, limit=PAGE_SIZE
+        ),
+        "repository.find_many.deep_offset": lambda run: repository.find_many(
+            **no_filters, offset=deep_offset, limit=PAGE_SIZE
+        ),
+        "repository.find_many.deep_keyset": lambda run: repository.find_many(
+            **no_filters, offset=0, limit=PAGE_SIZE, after_id=deep_offset
+        ),
+        "repository.count_many.all": lambda run: repository.count_many(**no_filters),
+        "use_case.get_book": lambda run: get_book.execute(
+            GetBookCommand(book_id=ids[run % len(ids)])
+        ),
+        "use_case.get_book_list": lambda run: get_book_list.execute(
+            GetBookListCommand(pagination=PaginationQuery(limit=PAGE_SIZE))
+        ),
+    }
+    for combo in filter_combinations():
+        search = {
+            name: FILTER_VALUES[name] if name in combo else None for name in FILTERS
+        }
+        label = "+".join(combo) or "none"
+        cases[f"repository.find_page[{label}]"] = (
+            lambda run, search=search: repository.find_page(
+                **search, offset=0, limit=PAGE_SIZE
+            )
+        )
+        cases[f"repository.count_many[{label}]"] = (
+            lambda run, search=search: repository.count_many(**search)
+        )
+    return cases
+
+
+def write_cases(
+    repository: SQLiteBookRepository, created: list[int]
+) -> dict[str, Case]:
+    # Created rows are updated and then deleted, so the seeded dataset is left as it was found.
+    def create(run: int) -> None:
+        created.append(
+            repository.create(
+                title=f"Bench {WORDS[run % 61]} {run}",
+                author=f"Author {run % AUTHORS}",
+                year=2000,
+            ).id
+        )
+
+    return {
+        "repository.create": create,
+        "repository.update": lambda run: repository.update(
+            created[run % len(created)], title=None, author=None, year=1900 + run % 125
+        ),
+        "repository.delete": lambda run: repository.delete(created.pop()),
+    }
+
+
+def measure(
+    case: Case, repeat: int, warmup: int, max_time: float, min_runs: int
+) -> Timing:
+    for run in range(warmup):
+        case(run)
+    samples = []
+    deadline = time.perf_counter() + max_time
+    for run in range(warmup, warmup + repeat):
+        started = time.perf_counter_ns()
+        case(run)
+        samples.append((time.perf_counter_ns() - started) / 1000)
+        if len(samples) >= min_runs and time.perf_counter() > deadline:
+            break
+    return Timing.from_samples(samples)
+
+
+def report(rows: int, name: str, timing: Timing) -> None:
+    print(f"{rows:>11,} {name:<44} {timing.median_us:>12,.1f} us", flush=True)
+
+
+def run_size(rows: int, args: argparse.Namespace) -> dict[str, Timing]:
+    database = Database(
+        url=f"sqlite:///{dataset(rows, args.fixtures_dir)}", slow_query_threshold=0
+    )
+    # A zero-sized count cache never stores, so every count reaches SQLite.
+    repository = SQLiteBookRepository(
+        database=database, count_cache=CountCache(max_size=0)
+    )
+    results = {}
+    try:
+        for name, case in read_cases(repository, rows, random.Random(rows)).items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure(
+                case, args.repeat, args.warmup, args.max_time, args.min_runs
+            )
+            report(rows, name, results[name])
+
+        # Write cases depend on each other and always run together, each exactly write-repeat times.
+        writes = write_cases(repository, [])
+        if not args.filter or any(args.filter in name for name in writes):
+            for name, case in writes.items():
+                results[name] = measure(
+                    case, args.write_repeat, 0, float("inf"), args.write_repeat
+                )
+                report(rows, name, results[name])
+    finally:
+        database.close()
+    return results
+
+
+def collect(args: argparse.Namespace) -> dict:
+    results = {}
+    for rows in args.sizes:
+        for name, timing in run_size(rows, args).items():
+            results[f"{name}@{rows}"] = asdict(timing)
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "sizes": list(args.sizes),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for key, timing in sorted(current["results"].items()):
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        ratio = timing["median_us"] / previous["median_us"]
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(
+            f"{key:<56} {previous['median_us']:>12,.1f} -> {timing['median_us']:>12,.1f} us  {ratio:6.2f}x {marker}"
+        )
+        if marker:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Repository and use-case latency against seeded datasets."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--fixtures-dir", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--filter", help="Only run cases whose name contains this text")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=200,
+        help="Upper bound on timed runs per read case",
+    )
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=2.0,
+        help="Seconds per read case once min-runs is reached",
+    )
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--write-repeat", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against an earlier --output file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Allowed median slowdown, 0.10 is 10%%",
+    )
+    args = parser.parse_args(argv)
+
+    current = collect(args)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2))
+        print(f"results written to {args.output}")
+    if args.baseline:
+        regressions = compare(
+            current, json.loads(args.baseline.read_text()), args.threshold
+        )
+        if regressions:
+            print(
+                f"{len(regressions)} cases slower than the baseline by more than {args.threshold:.0%}"
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from starlette.responses import Response
+
+from book_api.application.commands import GetBookListCommand, PaginationQuery
+from book_api.domain.entities import Book, BookPage
+from book_api.presentation.api.v1.responses import fast_response
+from book_api.presentation.api.v1.schemas import (
+    ApiResponse,
+    BookOutSchema,
+    ListPaginatedResponse,
+)
+from book_api.presentation.api.v1.views.books import (
+    build_list_payload,
+    build_list_response,
+)
+
+RESPONSE_FIELD = create_response_field(
+    name="response",
+    type_=ApiResponse[ListPaginatedResponse[BookOutSchema]],
+    mode="serialization",
+)
+
+
+def build_page(size: int) -> BookPage:
+    items = [
+        Book(
+            id=index,
+            title=f"Title {index}",
+            author=f"Author {index % 97}",
+            year=1900 + index % 120,
+        )
+        for index in range(size)
+    ]
+    return BookPage(items=items, total=size * 10, has_more=True)
+
+
+def standard_path(command: GetBookListCommand, page: BookPage) -> bytes:
+    content = ApiResponse(data=build_list_response(command, page))
+    serialized = asyncio.run(
+        serialize_response(field=RESPONSE_FIELD, response_content=content)
+    )
+    return JSONResponse(serialized).body
+
+
+def fast_path(command: GetBookListCommand, page: BookPage) -> bytes:
+    return fast_response(build_list_payload(command, page), Response()).body
+
+
+def measure(render, command: GetBookListCommand, page: BookPage, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render(command, page)
+    return (time.perf_counter() - started) / (rounds * len(page.items))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-item cost of rendering a list response."
+    )
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    command = GetBookListCommand(pagination=PaginationQuery(limit=args.limit))
+    page = build_page(args.limit)
+    for name, render in (("standard", standard_path), ("fast", fast_path)):
+        seconds = measure(render, command, page, args.rounds)
+        print(f"{name:>8}: {seconds * 1e6:.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+
+def start_server(workers: int, port: int, database: Path) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "SQLITE_FILE_PATH": str(database),
+        "BOOK_API_WORKERS": str(workers),
+        "SQLITE_SLOW_QUERY_THRESHOLD_MS": "0",
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "book_api.cli",
+        "serve",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+    ]
+    return subprocess.Popen(
+        command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/healthcheck").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+def seed(base_url: str, books: int) -> list[int]:
+    with httpx.Client(base_url=base_url) as client:
+        return [
+            client.post(
+                "/books/",
+                json={
+                    "title": f"Title {index}",
+                    "author": f"Author {index % 97}",
+                    "year": 2000,
+                },
+            ).json()["data"]["id"]
+            for index in range(books)
+        ]
+
+
+async def load(
+    base_url: str, ids: list[int], concurrency: int, duration: float, write_ratio: float
+) -> float:
+    completed = 0
+    deadline = time.monotonic() + duration
+    write_every = round(1 / write_ratio) if write_ratio else 0
+
+    async def client_loop(offset: int) -> None:
+        nonlocal completed
+        index = offset
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            while time.monotonic() < deadline:
+                book_id = ids[index % len(ids)]
+                if write_every and index % write_every == 0:
+                    await client.put(
+                        f"/books/{book_id}", json={"year": 1900 + index % 120}
+                    )
+                elif index % 2:
+                    await client.get(f"/books/{book_id}")
+                else:
+                    await client.get(
+                        "/books/",
+                        params={"author": f"Author {index % 97}", "limit": 20},
+                    )
+                completed += 1
+                index += concurrency
+
+    started = time.monotonic()
+    await asyncio.gather(*(client_loop(offset) for offset in range(concurrency)))
+    return completed / (time.monotonic() - started)
+
+
+def measure(workers: int, args: argparse.Namespace) -> float:
+    base_url = f"http://127.0.0.1:{args.port}"
+    with tempfile.TemporaryDirectory() as directory:
+        server = start_server(workers, args.port, Path(directory) / "bench.db")
+        try:
+            wait_until_ready(base_url)
+            ids = seed(base_url, args.books)
+            return asyncio.run(
+                load(base_url, ids, args.concurrency, args.duration, args.write_ratio)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="HTTP requests per second against uvicorn worker count."
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--books", type=int, default=200)
+    parser.add_argument(
+        "--write-ratio",
+        type=float,
+        default=0.05,
+        help="Share of requests that update a book",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    print(f"{os.cpu_count()} CPUs; the load generator shares them with the server")
+    for workers in args.workers:
+        rps = measure(workers, args)
+        print(f"workers {workers:>2}: {rps:8,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,53 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaginationQuery:
     page: int = 0
     limit: int = 10
+    after_id: int | None = None
+    include_total: bool = True
 
     @property
     def offset(self) -> int:
+        if self.after_id is not None:
+            return 0
         return self.page * self.limit
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookSearchQuery:
     title: str | None = None
     author: str | None = None
     year: int | None = None
+    text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetBookListCommand:
     search: BookSearchQuery = field(default_factory=BookSearchQuery)
     pagination: PaginationQuery = field(default_factory=PaginationQuery)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ExportBooksCommand:
+    search: BookSearchQuery = field(default_factory=BookSearchQuery)
+    batch_size: int = 1000
+
+
+@dataclass(slots=True, frozen=True)
 class GetBookCommand:
     book_id: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateBookCommand:
     title: str
     author: str
     year: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateBookCommand:
     book_id: int
     title: str | None = None
@@ -44,6 +55,21 @@ class UpdateBookCommand:
     year: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeleteBookCommand:
     book_id: int
+
+
+@dataclass(slots=True, frozen=True)
+class BulkCreateBooksCommand:
+    items: list[CreateBookCommand] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class BulkUpdateBooksCommand:
+    items: list[UpdateBookCommand] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class BulkDeleteBooksCommand:
+    book_ids: list[int] = field(default_factory=list)
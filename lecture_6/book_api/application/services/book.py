@@ -1,8 +1,11 @@
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from typing import Any
 
+from book_api.domain.entities import Book, BookPage
 from book_api.domain.errors import BookNotFound
-from book_api.domain.entities import Book
-from book_api.domain.services import IBookService
+from book_api.domain.services import IAsyncBookService, IBookService
+from book_api.gateways.sqlite.async_repositories import IAsyncBookRepository
 from book_api.gateways.sqlite.repositories import IBookRepository
 from book_api.helpers.errors import fail
 
@@ -17,21 +20,141 @@ class BookService(IBookService):
     def create(self, title: str, author: str, year: int | None) -> Book:
         return self.repository.create(title=title, author=author, year=year)
 
-    def update(self, book_id: int, *, title: str | None, author: str | None, year: int | None) -> Book:
-        return self.repository.update(book_id, title=title, author=author, year=year) or fail(BookNotFound())
+    def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
+        return self.repository.update(
+            book_id, title=title, author=author, year=year
+        ) or fail(BookNotFound())
 
     def delete(self, book_id: int) -> None:
         self.repository.delete(book_id) or fail(BookNotFound())
 
     def find_many(
-        self, *,
+        self,
+        *,
         offset: int,
         limit: int,
         title: str | None = None,
         author: str | None = None,
-        year: int | None = None
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
     ) -> list[Book]:
-        return self.repository.find_many(title=title, author=author, year=year, offset=offset, limit=limit)
+        return self.repository.find_many(
+            title=title,
+            author=author,
+            year=year,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            text=text,
+        )
 
-    def count_many(self, *, title: str | None = None, author: str | None = None, year: int | None = None) -> int:
-        return self.repository.count_many(title=title, author=author, year=year)
+    def count_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+    ) -> int:
+        return self.repository.count_many(
+            title=title, author=author, year=year, text=text
+        )
+
+    def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        return self.repository.find_page(
+            title=title,
+            author=author,
+            year=year,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            text=text,
+            include_total=include_total,
+        )
+
+    def iter_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        return self.repository.iter_many(
+            title=title,
+            author=author,
+            year=year,
+            text=text,
+            batch_size=batch_size,
+        )
+
+    def create_many(self, books: list[dict[str, Any]]) -> list[Book]:
+        return self.repository.create_many(books)
+
+    def update_many(self, changes: list[dict[str, Any]]) -> list[Book]:
+        return self.repository.update_many(changes)
+
+    def delete_many(self, book_ids: list[int]) -> list[int]:
+        return self.repository.delete_many(book_ids)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.repository.after_commit(callback)
+
+
+@dataclass
+class AsyncBookService(IAsyncBookService):
+    repository: IAsyncBookRepository
+
+    async def get_by_id(self, book_id: int) -> Book:
+        return await self.repository.get_by_id(book_id) or fail(BookNotFound())
+
+    async def create(self, title: str, author: str, year: int | None) -> Book:
+        return await self.repository.create(title=title, author=author, year=year)
+
+    async def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
+        return await self.repository.update(
+            book_id, title=title, author=author, year=year
+        ) or fail(BookNotFound())
+
+    async def delete(self, book_id: int) -> None:
+        await self.repository.delete(book_id) or fail(BookNotFound())
+
+    async def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        return await self.repository.find_page(
+            title=title,
+            author=author,
+            year=year,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            text=text,
+            include_total=include_total,
+        )
@@ -0,0 +1,149 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from book_api.application.services.book import BookService
+from book_api.domain.entities import Book, BookPage
+from book_api.domain.errors import BookNotFound
+from book_api.domain.services import IBookService
+from book_api.helpers.cache import LRUCache
+from book_api.helpers.errors import fail
+
+
+class BookCache(LRUCache):
+    pass
+
+
+@dataclass
+class CachedBookService(IBookService):
+    service: BookService
+    cache: BookCache
+
+    def _invalidate(self, book_ids: list[int]) -> None:
+        for book_id in book_ids:
+            self.cache.invalidate(book_id)
+
+    def _invalidate_after_commit(self, book_ids: list[int]) -> None:
+        # Dropping entries before the write commits would let a concurrent read cache the old row again.
+        self.service.after_commit(partial(self._invalidate, list(book_ids)))
+
+    def get_by_id(self, book_id: int) -> Book:
+        found, book = self.cache.get(book_id)
+        if found:
+            return book or fail(BookNotFound())
+        version = self.cache.version
+        try:
+            book = self.service.get_by_id(book_id)
+        except BookNotFound:
+            self.cache.set(book_id, None, version=version)
+            raise
+        self.cache.set(book_id, book, version=version)
+        return book
+
+    def create(self, title: str, author: str, year: int | None) -> Book:
+        book = self.service.create(title, author, year)
+        self._invalidate_after_commit([book.id])
+        return book
+
+    def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
+        try:
+            return self.service.update(book_id, title=title, author=author, year=year)
+        finally:
+            self._invalidate_after_commit([book_id])
+
+    def delete(self, book_id: int) -> None:
+        try:
+            self.service.delete(book_id)
+        finally:
+            self._invalidate_after_commit([book_id])
+
+    def find_many(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+    ) -> list[Book]:
+        return self.service.find_many(
+            offset=offset,
+            limit=limit,
+            title=title,
+            author=author,
+            year=year,
+            after_id=after_id,
+            text=text,
+        )
+
+    def count_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+    ) -> int:
+        return self.service.count_many(title=title, author=author, year=year, text=text)
+
+    def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        return self.service.find_page(
+            offset=offset,
+            limit=limit,
+            title=title,
+            author=author,
+            year=year,
+            after_id=after_id,
+            text=text,
+            include_total=include_total,
+        )
+
+    def iter_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        return self.service.iter_many(
+            title=title,
+            author=author,
+            year=year,
+            text=text,
+            batch_size=batch_size,
+        )
+
+    def create_many(self, books: list[dict[str, Any]]) -> list[Book]:
+        created = self.service.create_many(books)
+        self._invalidate_after_commit([book.id for book in created])
+        return created
+
+    def update_many(self, changes: list[dict[str, Any]]) -> list[Book]:
+        try:
+            return self.service.update_many(changes)
+        finally:
+            self._invalidate_after_commit([change["id"] for change in changes])
+
+    def delete_many(self, book_ids: list[int]) -> list[int]:
+        try:
+            return self.service.delete_many(book_ids)
+        finally:
+            self._invalidate_after_commit(book_ids)
@@ -1,15 +1,19 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import List, Tuple
 
 from book_api.application.commands import (
+    BulkCreateBooksCommand,
+    BulkDeleteBooksCommand,
+    BulkUpdateBooksCommand,
     CreateBookCommand,
     DeleteBookCommand,
+    ExportBooksCommand,
     GetBookCommand,
     GetBookListCommand,
     UpdateBookCommand,
 )
-from book_api.domain.entities import Book
-from book_api.domain.services import IBookService
+from book_api.domain.entities import Book, BookPage
+from book_api.domain.services import IAsyncBookService, IBookService
 
 
 @dataclass
@@ -18,24 +22,41 @@ class BaseUseCase:
         raise NotImplementedError
 
 
+@dataclass
+class BaseAsyncUseCase:
+    async def execute(self, *args, **kwargs):
+        raise NotImplementedError
+
+
 @dataclass
 class GetBookListUseCase(BaseUseCase):
     book_service: IBookService
 
-    def execute(self, command: GetBookListCommand) -> Tuple[List[Book], int]:
-        books = self.book_service.find_many(
+    def execute(self, command: GetBookListCommand) -> BookPage:
+        return self.book_service.find_page(
             offset=command.pagination.offset,
             limit=command.pagination.limit,
             title=command.search.title,
             author=command.search.author,
             year=command.search.year,
+            after_id=command.pagination.after_id,
+            text=command.search.text,
+            include_total=command.pagination.include_total,
         )
-        total = self.book_service.count_many(
+
+
+@dataclass
+class ExportBooksUseCase(BaseUseCase):
+    book_service: IBookService
+
+    def execute(self, command: ExportBooksCommand) -> Iterator[Book]:
+        return self.book_service.iter_many(
             title=command.search.title,
             author=command.search.author,
             year=command.search.year,
+            text=command.search.text,
+            batch_size=command.batch_size,
         )
-        return books, total
 
 
 @dataclass
@@ -72,4 +93,115 @@ class DeleteBookUseCase(BaseUseCase):
     book_service: IBookService
 
     def execute(self, command: DeleteBookCommand) -> None:
-        return self.book_service.delete(command.book_id)
\ No newline at end of file
+        return self.book_service.delete(command.book_id)
+
+
+@dataclass
+class BulkCreateBooksUseCase(BaseUseCase):
+    book_service: IBookService
+
+    def execute(self, command: BulkCreateBooksCommand) -> list[Book]:
+        return self.book_service.create_many(
+            [
+                {"title": item.title, "author": item.author, "year": item.year}
+                for item in command.items
+            ]
+        )
+
+
+@dataclass
+class BulkUpdateBooksUseCase(BaseUseCase):
+    book_service: IBookService
+
+    def execute(self, command: BulkUpdateBooksCommand) -> tuple[list[Book], list[int]]:
+        changes = []
+        for item in command.items:
+            change = {"id": item.book_id}
+            if item.title is not None:
+                change["title"] = item.title
+            if item.author is not None:
+                change["author"] = item.author
+            if item.year is not None:
+                change["year"] = item.year
+            changes.append(change)
+        books = self.book_service.update_many(changes)
+        updated_ids = {book.id for book in books}
+        missing_ids = list(
+            dict.fromkeys(
+                item.book_id
+                for item in command.items
+                if item.book_id not in updated_ids
+            )
+        )
+        return books, missing_ids
+
+
+@dataclass
+class BulkDeleteBooksUseCase(BaseUseCase):
+    book_service: IBookService
+
+    def execute(self, command: BulkDeleteBooksCommand) -> tuple[list[int], list[int]]:
+        deleted_ids = self.book_service.delete_many(command.book_ids)
+        deleted = set(deleted_ids)
+        missing_ids = list(
+            dict.fromkeys(
+                book_id for book_id in command.book_ids if book_id not in deleted
+            )
+        )
+        return deleted_ids, missing_ids
+
+
+@dataclass
+class AsyncGetBookListUseCase(BaseAsyncUseCase):
+    book_service: IAsyncBookService
+
+    async def execute(self, command: GetBookListCommand) -> BookPage:
+        return await self.book_service.find_page(
+            offset=command.pagination.offset,
+            limit=command.pagination.limit,
+            title=command.search.title,
+            author=command.search.author,
+            year=command.search.year,
+            after_id=command.pagination.after_id,
+            text=command.search.text,
+            include_total=command.pagination.include_total,
+        )
+
+
+@dataclass
+class AsyncGetBookUseCase(BaseAsyncUseCase):
+    book_service: IAsyncBookService
+
+    async def execute(self, command: GetBookCommand) -> Book:
+        return await self.book_service.get_by_id(command.book_id)
+
+
+@dataclass
+class AsyncCreateBookUseCase(BaseAsyncUseCase):
+    book_service: IAsyncBookService
+
+    async def execute(self, command: CreateBookCommand) -> Book:
+        return await self.book_service.create(
+            command.title, command.author, command.year
+        )
+
+
+@dataclass
+class AsyncUpdateBookUseCase(BaseAsyncUseCase):
+    book_service: IAsyncBookService
+
+    async def execute(self, command: UpdateBookCommand) -> Book:
+        return await self.book_service.update(
+            command.book_id,
+            title=command.title,
+            author=command.author,
+            year=command.year,
+        )
+
+
+@dataclass
+class AsyncDeleteBookUseCase(BaseAsyncUseCase):
+    book_service: IAsyncBookService
+
+    async def execute(self, command: DeleteBookCommand) -> None:
+        return await self.book_service.delete(command.book_id)
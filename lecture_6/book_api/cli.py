@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import uvicorn
+
+from book_api.application.use_cases import BulkCreateBooksUseCase
+from book_api.core.configs import settings
+from book_api.core.container import get_container
+from book_api.gateways.sqlite.database import Database
+from book_api.presentation.importing import import_books
+
+
+def rebuild_search_index(args: argparse.Namespace) -> None:
+    db = get_container().resolve(Database)
+    db.create_tables()
+    db.rebuild_search_index()
+    print("Full-text search index rebuilt")
+
+
+def import_catalog(args: argparse.Namespace) -> None:
+    container = get_container()
+    container.resolve(Database).create_tables()
+    use_case = container.resolve(BulkCreateBooksUseCase)
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+
+    with args.path.open(
+        encoding="utf-8", errors="surrogateescape", newline=""
+    ) as lines:
+        report = import_books(
+            lines,
+            fmt,
+            use_case,
+            chunk_size=args.chunk_size,
+            max_errors=settings.BOOK_IMPORT_MAX_REPORTED_ERRORS,
+        )
+
+    for error in report.errors:
+        print(
+            f"line {error.line}: {json.dumps(error.detail, default=str)}",
+            file=sys.stderr,
+        )
+    print(
+        f"Imported {report.imported} books in {report.chunks} chunks, {report.failed} rows failed"
+    )
+
+
+def serve(args: argparse.Namespace) -> None:
+    # Workers start together, so the schema is created once here rather than raced in every lifespan.
+    db = get_container().resolve(Database)
+    db.create_tables()
+    db.close()
+    get_container.cache_clear()
+
+    # Workers read their settings from the environment and switch on cross-process cache coherence.
+    os.environ["BOOK_API_WORKERS"] = str(args.workers)
+    uvicorn.run(
+        "book_api.main:app", host=args.host, port=args.port, workers=args.workers
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="book-api", description="Book API maintenance commands"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-search-index", help="Rebuild the FTS5 index from the books table"
+    )
+    rebuild_parser.set_defaults(handler=rebuild_search_index)
+
+    import_parser = subparsers.add_parser(
+        "import", help="Import books from an NDJSON or CSV file"
+    )
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument(
+        "--format", choices=("ndjson", "csv"), help="Defaults to the file extension"
+    )
+    import_parser.add_argument(
+        "--chunk-size", type=int, default=settings.BOOK_IMPORT_CHUNK_SIZE
+    )
+    import_parser.set_defaults(handler=import_catalog)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run the API, optionally across several worker processes"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--workers", type=int, default=settings.BOOK_API_WORKERS)
+    serve_parser.set_defaults(handler=serve)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
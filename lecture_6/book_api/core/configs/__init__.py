@@ -1,9 +1,11 @@
 from pydantic_settings import SettingsConfigDict
 
+from book_api.core.configs.api import ApiSettings
+from book_api.core.configs.cache import CacheSettings
 from book_api.core.configs.database import SQLiteSettings
 
 
-class Settings(SQLiteSettings):
+class Settings(SQLiteSettings, ApiSettings, CacheSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -0,0 +1,21 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+
+class ApiSettings(BaseSettings):
+    BOOK_API_IO_MODE: Literal["sync", "async"] = "sync"
+    BOOK_API_WORKERS: int = 1
+    BOOK_DI_PRERESOLVE: bool = True
+    BOOK_API_FAST_JSON: bool = False
+    BOOK_API_METRICS_ENABLED: bool = True
+    BOOK_IMPORT_CHUNK_SIZE: int = 1000
+    BOOK_IMPORT_MAX_REPORTED_ERRORS: int = 1000
+
+    @property
+    def is_async(self) -> bool:
+        return self.BOOK_API_IO_MODE == "async"
+
+    @property
+    def is_multi_worker(self) -> bool:
+        return self.BOOK_API_WORKERS > 1
@@ -0,0 +1,11 @@
+from pydantic_settings import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    BOOK_CACHE_ENABLED: bool = True
+    BOOK_CACHE_MAX_SIZE: int = 10_000
+    BOOK_CACHE_TTL_SECONDS: float = 30.0
+    BOOK_CACHE_NEGATIVE_TTL_SECONDS: float = 5.0
+    BOOK_COUNT_CACHE_MAX_SIZE: int = 1024
+    BOOK_COUNT_CACHE_TTL_SECONDS: float = 60.0
+    BOOK_CACHE_COHERENCE_INTERVAL_MS: float = 0.0
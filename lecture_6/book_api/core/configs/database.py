@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
@@ -5,17 +7,57 @@ from pydantic_settings import BaseSettings
 class SQLiteSettings(BaseSettings):
     SQLITE_FILE_PATH: str = "book_api.db"
     SQLITE_URL: str | None = None
+    SQLITE_ASYNC_URL: str | None = None
+
+    SQLITE_JOURNAL_MODE: Literal[
+        "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"
+    ] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+
+    SQLITE_READ_ONLY_POOL: bool = True
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITE_POOL_SIZE: int = 2
+    SQLITE_ASYNC_POOL_SIZE: int = 8
+
+    SQLITE_GROUP_COMMIT_ENABLED: bool = False
+    SQLITE_GROUP_COMMIT_MAX_BATCH: int = 64
+    SQLITE_GROUP_COMMIT_MAX_DELAY_MS: float = 0.0
+    SQLITE_GROUP_COMMIT_TIMEOUT_SECONDS: float = 30.0
+
+    SQLITE_SLOW_QUERY_THRESHOLD_MS: float = 100.0
 
-    @model_validator(mode="before") # noqa
+    @model_validator(mode="before")  # noqa
     @classmethod
     def assemble_sqlite_url(cls, values: dict) -> dict:
-        if values.get("SQLITE_URL"):
-            return values
+        if not values.get("SQLITE_URL"):
+            file_path = values.get("SQLITE_FILE_PATH", "book_api.db")
+            values["SQLITE_URL"] = f"sqlite:///{file_path}"
 
-        file_path = values.get("SQLITE_FILE_PATH", "book_api.db")
-        values["SQLITE_URL"] = f"sqlite:///{file_path}"
+        if not values.get("SQLITE_ASYNC_URL"):
+            values["SQLITE_ASYNC_URL"] = values["SQLITE_URL"].replace(
+                "sqlite://", "sqlite+aiosqlite://", 1
+            )
         return values
 
     @property
     def sqlite_url(self) -> str:
         return self.SQLITE_URL
+
+    @property
+    def sqlite_async_url(self) -> str:
+        return self.SQLITE_ASYNC_URL
+
+    @property
+    def sqlite_pragmas(self) -> dict[str, str | int]:
+        return {
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+            "temp_store": self.SQLITE_TEMP_STORE,
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT,
+        }
@@ -1,18 +1,42 @@
+import os
+from collections.abc import Iterable
 from functools import lru_cache
+from typing import Any
 
 import punq
 
-from book_api.domain.services import IBookService
+from book_api.application.services.book import AsyncBookService, BookService
+from book_api.application.services.cached import BookCache, CachedBookService
 from book_api.application.use_cases import (
+    AsyncCreateBookUseCase,
+    AsyncDeleteBookUseCase,
+    AsyncGetBookListUseCase,
+    AsyncGetBookUseCase,
+    AsyncUpdateBookUseCase,
+    BulkCreateBooksUseCase,
+    BulkDeleteBooksUseCase,
+    BulkUpdateBooksUseCase,
     CreateBookUseCase,
     DeleteBookUseCase,
+    ExportBooksUseCase,
     GetBookListUseCase,
     GetBookUseCase,
     UpdateBookUseCase,
 )
-from book_api.gateways.sqlite.database import Database
+from book_api.core.configs import settings
+from book_api.domain.services import IAsyncBookService, IBookService
+from book_api.gateways.sqlite.async_repositories import (
+    AsyncSQLiteBookRepository,
+    IAsyncBookRepository,
+)
+from book_api.gateways.sqlite.caching import CountCache, WriteGeneration
+from book_api.gateways.sqlite.coherence import DataVersionMonitor
+from book_api.gateways.sqlite.database import AsyncDatabase, Database
+from book_api.gateways.sqlite.group_commit import (
+    GroupCommitBookRepository,
+    GroupCommitWriter,
+)
 from book_api.gateways.sqlite.repositories import IBookRepository, SQLiteBookRepository
-from book_api.application.services.book import BookService
 
 
 @lru_cache(1)
@@ -20,14 +44,146 @@ def get_container() -> punq.Container:
     return init_container()
 
 
-def init_container() -> punq.Container:
+def _reset_container_after_fork() -> None:
+    # A container built before a preloading process manager forks holds the parent's engines
+    # and writer thread; each worker builds its own on first use instead.
+    if get_container.cache_info().currsize:
+        get_container().resolve(Database).discard_inherited_connections()
+        get_container.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_container_after_fork)
+
+
+def create_book_cache() -> BookCache:
+    return BookCache(
+        max_size=settings.BOOK_CACHE_MAX_SIZE,
+        ttl=settings.BOOK_CACHE_TTL_SECONDS,
+        negative_ttl=settings.BOOK_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+
+
+SYNC_GRAPH = (
+    IBookRepository,
+    BookService,
+    IBookService,
+    GetBookListUseCase,
+    ExportBooksUseCase,
+    GetBookUseCase,
+    CreateBookUseCase,
+    UpdateBookUseCase,
+    DeleteBookUseCase,
+    BulkCreateBooksUseCase,
+    BulkUpdateBooksUseCase,
+    BulkDeleteBooksUseCase,
+)
+
+ASYNC_GRAPH = (
+    IAsyncBookRepository,
+    IAsyncBookService,
+    AsyncGetBookListUseCase,
+    AsyncGetBookUseCase,
+    AsyncCreateBookUseCase,
+    AsyncUpdateBookUseCase,
+    AsyncDeleteBookUseCase,
+)
+
+
+def preresolve(container: punq.Container, types: Iterable[Any]) -> punq.Container:
+    # Order matters: each type is pinned before its dependants are resolved, so they share one instance.
+    for type_ in types:
+        container.register(type_, instance=container.resolve(type_))
+    return container
+
+
+def create_group_commit_writer(
+    database: Database, generation: WriteGeneration
+) -> GroupCommitWriter:
+    return GroupCommitWriter(
+        database=database,
+        generation=generation,
+        max_batch=settings.SQLITE_GROUP_COMMIT_MAX_BATCH,
+        max_delay=settings.SQLITE_GROUP_COMMIT_MAX_DELAY_MS / 1000,
+        timeout=settings.SQLITE_GROUP_COMMIT_TIMEOUT_SECONDS,
+    )
+
+
+def create_data_version_monitor(
+    database: Database,
+    generation: WriteGeneration,
+    book_cache: BookCache,
+) -> DataVersionMonitor:
+    return DataVersionMonitor(
+        url=database.url,
+        generation=generation,
+        caches=(book_cache,),
+        interval=settings.BOOK_CACHE_COHERENCE_INTERVAL_MS / 1000,
+    )
+
+
+def init_container(*, preresolve_graph: bool | None = None) -> punq.Container:
+    if preresolve_graph is None:
+        preresolve_graph = settings.BOOK_DI_PRERESOLVE
+
     container = punq.Container()
     container.register(Database, factory=lambda: Database(), scope=punq.Scope.singleton)
-    container.register(IBookRepository, SQLiteBookRepository)
-    container.register(IBookService, BookService)
+    container.register(WriteGeneration, instance=WriteGeneration())
+    container.register(
+        CountCache,
+        instance=CountCache(
+            max_size=settings.BOOK_COUNT_CACHE_MAX_SIZE,
+            ttl=settings.BOOK_COUNT_CACHE_TTL_SECONDS,
+        ),
+    )
+    container.register(
+        GroupCommitWriter,
+        factory=lambda: create_group_commit_writer(
+            container.resolve(Database), container.resolve(WriteGeneration)
+        ),
+        scope=punq.Scope.singleton,
+    )
+    if settings.SQLITE_GROUP_COMMIT_ENABLED:
+        container.register(IBookRepository, GroupCommitBookRepository)
+    else:
+        container.register(IBookRepository, SQLiteBookRepository)
+    container.register(BookService)
+    container.register(BookCache, instance=create_book_cache())
+    container.register(
+        DataVersionMonitor,
+        factory=lambda: create_data_version_monitor(
+            container.resolve(Database),
+            container.resolve(WriteGeneration),
+            container.resolve(BookCache),
+        ),
+        scope=punq.Scope.singleton,
+    )
+    if settings.BOOK_CACHE_ENABLED:
+        container.register(IBookService, CachedBookService)
+    else:
+        container.register(IBookService, BookService)
     container.register(GetBookListUseCase)
+    container.register(ExportBooksUseCase)
     container.register(GetBookUseCase)
     container.register(CreateBookUseCase)
     container.register(UpdateBookUseCase)
     container.register(DeleteBookUseCase)
+    container.register(BulkCreateBooksUseCase)
+    container.register(BulkUpdateBooksUseCase)
+    container.register(BulkDeleteBooksUseCase)
+
+    container.register(
+        AsyncDatabase, factory=lambda: AsyncDatabase(), scope=punq.Scope.singleton
+    )
+    container.register(IAsyncBookRepository, AsyncSQLiteBookRepository)
+    container.register(IAsyncBookService, AsyncBookService)
+    container.register(AsyncGetBookListUseCase)
+    container.register(AsyncGetBookUseCase)
+    container.register(AsyncCreateBookUseCase)
+    container.register(AsyncUpdateBookUseCase)
+    container.register(AsyncDeleteBookUseCase)
+
+    if preresolve_graph:
+        preresolve(container, SYNC_GRAPH)
+        if settings.is_async:
+            preresolve(container, ASYNC_GRAPH)
     return container
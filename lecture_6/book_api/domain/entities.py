@@ -1,9 +1,16 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Book:
     id: int
     title: str
     author: str
     year: int | None
+
+
+@dataclass(slots=True)
+class BookPage:
+    items: list[Book]
+    total: int | None
+    has_more: bool
@@ -7,4 +7,12 @@ class BookNotFound(BaseDomainException):
 
 
 class InvalidBookData(BaseDomainException):
-    pass
\ No newline at end of file
+    pass
+
+
+class UnsupportedPagination(BaseDomainException):
+    pass
+
+
+class InvalidSearchQuery(BaseDomainException):
+    pass
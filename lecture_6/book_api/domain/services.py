@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from book_api.domain.entities import Book
+from collections.abc import Iterator
+from typing import Any
+
+from book_api.domain.entities import Book, BookPage
 
 
 class IBookService(ABC):
@@ -12,7 +15,9 @@ class IBookService(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, book_id: int, *, title: str | None, author: str | None, year: int | None) -> Book:
+    def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
         raise NotImplementedError
 
     @abstractmethod
@@ -28,9 +33,92 @@ class IBookService(ABC):
         title: str | None = None,
         author: str | None = None,
         year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
     ) -> list[Book]:
         raise NotImplementedError
 
     @abstractmethod
-    def count_many(self, *, title: str | None = None, author: str | None = None, year: int | None = None) -> int:
+    def count_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_many(self, books: list[dict[str, Any]]) -> list[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, changes: list[dict[str, Any]]) -> list[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, book_ids: list[int]) -> list[int]:
+        raise NotImplementedError
+
+
+class IAsyncBookService(ABC):
+    @abstractmethod
+    async def get_by_id(self, book_id: int) -> Book:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, title: str, author: str, year: int | None) -> Book:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, book_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
         raise NotImplementedError
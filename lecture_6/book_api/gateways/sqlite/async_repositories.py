@@ -0,0 +1,152 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from book_api.domain.entities import Book, BookPage
+from book_api.gateways.sqlite.caching import (
+    CountCache,
+    WriteGeneration,
+    count_cache_key,
+)
+from book_api.gateways.sqlite.database import AsyncDatabase
+from book_api.gateways.sqlite.models import book_from_row
+from book_api.gateways.sqlite.queries import (
+    book_by_id_query,
+    changed_values,
+    count_query,
+    delete_book_query,
+    insert_books_query,
+    needs_count_fallback,
+    page_with_total_query,
+    update_book_query,
+)
+
+
+@dataclass
+class IAsyncBookRepository(ABC):
+    database: AsyncDatabase
+    generation: WriteGeneration = field(default_factory=WriteGeneration)
+    count_cache: CountCache = field(default_factory=CountCache)
+
+    @property
+    def session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        return self.database.session_scope()
+
+    @abstractmethod
+    async def get_by_id(self, oid: int) -> Book | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, *, title: str, author: str, year: int | None) -> Book:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+        self, oid: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, oid: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        raise NotImplementedError
+
+
+@dataclass
+class AsyncSQLiteBookRepository(IAsyncBookRepository):
+    async def get_by_id(self, oid: int) -> Book | None:
+        async with self.session as session:
+            connection = await session.connection()
+            row = (await connection.execute(*book_by_id_query(oid))).first()
+            return book_from_row(row) if row else None
+
+    async def create(self, *, title: str, author: str, year: int | None) -> Book:
+        async with self.session as session:
+            connection = await session.connection()
+            values = {"title": title, "author": author, "year": year}
+            row = (await connection.execute(insert_books_query(), values)).one()
+            await self.database.commit(session, self.generation.bump)
+            return book_from_row(row)
+
+    async def update(
+        self, oid: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book | None:
+        values = changed_values(title=title, author=author, year=year)
+        if not values:
+            return await self.get_by_id(oid)
+        async with self.session as session:
+            connection = await session.connection()
+            row = (await connection.execute(update_book_query(oid, values))).first()
+            await self.database.commit(
+                session, self.generation.bump if row is not None else None
+            )
+            return book_from_row(row) if row else None
+
+    async def delete(self, oid: int) -> bool:
+        async with self.session as session:
+            connection = await session.connection()
+            deleted_id = (await connection.execute(delete_book_query(oid))).scalar()
+            deleted = deleted_id is not None
+            await self.database.commit(
+                session, self.generation.bump if deleted else None
+            )
+            return deleted
+
+    async def find_page(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        key = count_cache_key(self.generation.value, title, author, year, text)
+        found, total = self.count_cache.get(key) if include_total else (False, None)
+        query = page_with_total_query(
+            title,
+            author,
+            year,
+            text,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            include_total=include_total and not found,
+        )
+        async with self.session as session:
+            connection = await session.connection()
+            rows = (await connection.execute(*query)).all()
+            if include_total and not found:
+                if rows:
+                    total = rows[0].total
+                elif needs_count_fallback(rows, offset=offset, after_id=after_id):
+                    total = (
+                        await connection.execute(
+                            *count_query(title, author, year, text)
+                        )
+                    ).scalar_one()
+                else:
+                    total = 0
+                self.count_cache.set(key, total)
+
+            books = [book_from_row(row) for row in rows[:limit]]
+            return BookPage(items=books, total=total, has_more=len(rows) > limit)
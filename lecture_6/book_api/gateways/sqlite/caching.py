@@ -0,0 +1,34 @@
+import threading
+
+from book_api.gateways.sqlite.models import build_match_expression
+from book_api.helpers.cache import LRUCache
+
+
+class WriteGeneration:
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+class CountCache(LRUCache):
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        super().__init__(max_size=max_size, ttl=ttl)
+
+
+def count_cache_key(
+    generation: int,
+    title: str | None,
+    author: str | None,
+    year: int | None,
+    text: str | None,
+) -> tuple:
+    return generation, title or None, author or None, year, build_match_expression(text)
@@ -0,0 +1,80 @@
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import make_url
+
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.helpers.cache import LRUCache
+
+
+def data_version_path(url: str) -> str | None:
+    database = make_url(url).database
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return f"file:{database}?mode=ro"
+
+
+class DataVersionMonitor:
+    def __init__(
+        self,
+        url: str,
+        generation: WriteGeneration,
+        caches: Iterable[LRUCache] = (),
+        interval: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.generation = generation
+        self.caches = tuple(caches)
+        self.interval = interval
+        self.changes = 0
+        self._clock = clock
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        path = data_version_path(url)
+        # PRAGMA data_version only moves for commits made by *other* connections, so the monitor
+        # keeps one of its own that never writes and sees every worker's commits, including ours.
+        self._connection = (
+            None
+            if path is None
+            else sqlite3.connect(path, uri=True, check_same_thread=False)
+        )
+        self._version = self._read_version()
+
+    @property
+    def enabled(self) -> bool:
+        return self._connection is not None
+
+    def _read_version(self) -> int | None:
+        if self._connection is None:
+            return None
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def sync(self) -> bool:
+        if self._connection is None or self._clock() < self._next_check:
+            return False
+        with self._lock:
+            self._next_check = self._clock() + self.interval
+            version = self._read_version()
+            if version == self._version:
+                return False
+            self._version = version
+            self.changes += 1
+        self.generation.bump()
+        for cache in self.caches:
+            cache.clear()
+        return True
+
+    def snapshot(self) -> dict[str, int | bool | None]:
+        return {
+            "enabled": self.enabled,
+            "data_version": self._version,
+            "changes": self.changes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
@@ -1,27 +1,332 @@
-from sqlalchemy import create_engine
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from book_api.core.configs import settings
-from book_api.gateways.sqlite.models import BaseORM
+from book_api.gateways.sqlite.metrics import (
+    DatabaseMetrics,
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    install_database_metrics,
+)
+from book_api.gateways.sqlite.models import (
+    BaseORM,
+    create_search_index,
+    rebuild_search_index,
+)
+from book_api.gateways.sqlite.pragmas import install_pragmas, read_pragmas
+from book_api.gateways.sqlite.slow_queries import SlowQueryLog, install_slow_query_log
+from book_api.gateways.sqlite.statement_cache import (
+    StatementCacheStats,
+    install_statement_cache_stats,
+)
+from book_api.gateways.sqlite.unit_of_work import (
+    AsyncUnitOfWork,
+    UnitOfWork,
+    current_async_unit_of_work,
+    current_unit_of_work,
+)
+
+# Persistent, database-wide settings need a writable connection and are left to the writer pool.
+WRITER_ONLY_PRAGMAS = frozenset({"journal_mode"})
+
+
+def read_only_url(url: str) -> str | None:
+    sqlite_url = make_url(url)
+    database = sqlite_url.database
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return sqlite_url.set(
+        database=f"file:{database}", query={"mode": "ro", "uri": "true"}
+    ).render_as_string()
 
 
 class Database:
-    def __init__(self, url: str | None = None) -> None:
+    def __init__(
+        self,
+        url: str | None = None,
+        pragmas: dict[str, str | int] | None = None,
+        read_only_pool: bool | None = None,
+        slow_query_threshold: float | None = None,
+    ) -> None:
         db_url = url or settings.sqlite_url
         connect_args = {"check_same_thread": False}
-        self.engine = create_engine(db_url, connect_args=connect_args)
-        self._session_factory = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+        self.url = db_url
+        self.pragmas = settings.sqlite_pragmas if pragmas is None else pragmas
+        self.statement_cache_stats = StatementCacheStats()
+        self.metrics = DatabaseMetrics()
+        if slow_query_threshold is None:
+            slow_query_threshold = settings.SQLITE_SLOW_QUERY_THRESHOLD_MS / 1000
+        self.slow_queries = SlowQueryLog(slow_query_threshold)
+        if read_only_pool is None:
+            read_only_pool = settings.SQLITE_READ_ONLY_POOL
+        file_url = read_only_url(db_url)
+        read_url = file_url if read_only_pool else None
+
+        if read_url is None:
+            # In-memory databases keep SQLAlchemy's default pool, which pins one connection per thread.
+            pool_args = {"poolclass": TimedQueuePool} if file_url else {}
+            self.engine = create_engine(db_url, connect_args=connect_args, **pool_args)
+            self.read_engine = self.engine
+        else:
+            self.engine = create_engine(
+                db_url,
+                connect_args=connect_args,
+                poolclass=TimedQueuePool,
+                pool_size=settings.SQLITE_WRITE_POOL_SIZE,
+                max_overflow=0,
+            )
+            self.read_engine = create_engine(
+                read_url,
+                connect_args=connect_args,
+                poolclass=TimedQueuePool,
+                pool_size=settings.SQLITE_READ_POOL_SIZE,
+                max_overflow=0,
+            )
+            reader_pragmas = {
+                name: value
+                for name, value in self.pragmas.items()
+                if name not in WRITER_ONLY_PRAGMAS
+            }
+            install_pragmas(self.read_engine, reader_pragmas)
+            install_statement_cache_stats(self.read_engine, self.statement_cache_stats)
+            install_database_metrics(self.read_engine, self.metrics, "reader")
+            install_slow_query_log(self.read_engine, self.slow_queries)
+
+        install_pragmas(self.engine, self.pragmas)
+        install_statement_cache_stats(self.engine, self.statement_cache_stats)
+        install_database_metrics(self.engine, self.metrics, "writer")
+        install_slow_query_log(self.engine, self.slow_queries)
+        self._session_factory = sessionmaker(
+            bind=self.engine, autocommit=False, autoflush=False
+        )
+        self._read_session_factory = sessionmaker(
+            bind=self.read_engine, autocommit=False, autoflush=False
+        )
         self._tables_created = False
 
     @property
     def connection(self) -> Session:
         return self._session_factory()
 
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        unit_of_work = current_unit_of_work.get()
+        if (
+            unit_of_work is not None
+            and unit_of_work.session_factory is self._session_factory
+        ):
+            yield unit_of_work.session
+            return
+        with self._session_factory() as session:
+            yield session
+
+    @contextmanager
+    def read_scope(self) -> Iterator[Session]:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.session_factory in (
+            self._session_factory,
+            self._read_session_factory,
+        ):
+            yield unit_of_work.session
+            return
+        with self._read_session_factory() as session:
+            yield session
+
+    def _write_unit_of_work(self) -> UnitOfWork | None:
+        unit_of_work = current_unit_of_work.get()
+        if (
+            unit_of_work is not None
+            and unit_of_work.write
+            and unit_of_work.session_factory is self._session_factory
+        ):
+            return unit_of_work
+        return None
+
+    def commit(
+        self, session: Session, on_commit: Callable[[], None] | None = None
+    ) -> None:
+        # Inside a write unit of work the request commits or rolls back as a whole, so writes
+        # are only flushed here and their side effects wait for that commit.
+        unit_of_work = self._write_unit_of_work()
+        if unit_of_work is not None and unit_of_work.holds(session):
+            session.flush()
+            if on_commit is not None:
+                unit_of_work.after_commit(on_commit)
+            return
+        session.commit()
+        if on_commit is not None:
+            on_commit()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        unit_of_work = self._write_unit_of_work()
+        if unit_of_work is None:
+            callback()
+        else:
+            unit_of_work.after_commit(callback)
+
+    @contextmanager
+    def unit_of_work(self, *, write: bool = False) -> Iterator[UnitOfWork]:
+        session_factory = self._session_factory if write else self._read_session_factory
+        unit_of_work = UnitOfWork(session_factory, write=write)
+        token = current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+        except BaseException:
+            unit_of_work.rollback()
+            raise
+        else:
+            unit_of_work.commit()
+        finally:
+            unit_of_work.close()
+            current_unit_of_work.reset(token)
+
     def create_tables(self) -> None:
         if self._tables_created:
             return
         BaseORM.metadata.create_all(bind=self.engine)
+        with self.engine.begin() as connection:
+            create_search_index(connection)
         self._tables_created = True
 
+    def effective_pragmas(self) -> dict[str, str | int]:
+        with self.engine.connect() as connection:
+            return read_pragmas(connection, self.pragmas)
+
+    def rebuild_search_index(self) -> None:
+        with self.engine.begin() as connection:
+            rebuild_search_index(connection)
+
+    def discard_inherited_connections(self) -> None:
+        # SQLite handles must not cross a fork; drop them in the child without closing the parent's.
+        self.read_engine.dispose(close=False)
+        self.engine.dispose(close=False)
+
     def close(self) -> None:
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
         self.engine.dispose()
+
+
+def _create_schema(connection: Connection) -> None:
+    BaseORM.metadata.create_all(bind=connection)
+    create_search_index(connection)
+
+
+class AsyncDatabase:
+    def __init__(
+        self,
+        url: str | None = None,
+        pragmas: dict[str, str | int] | None = None,
+        slow_query_threshold: float | None = None,
+    ) -> None:
+        db_url = url or settings.sqlite_async_url
+        # Without an explicit pool a file URL gets NullPool: a new connection, aiosqlite thread and
+        # PRAGMA round per session. In-memory databases keep the default pool.
+        pool_args = (
+            {
+                "poolclass": TimedAsyncAdaptedQueuePool,
+                "pool_size": settings.SQLITE_ASYNC_POOL_SIZE,
+                "max_overflow": 0,
+            }
+            if read_only_url(db_url)
+            else {}
+        )
+        self.engine = create_async_engine(db_url, **pool_args)
+        self.pragmas = settings.sqlite_pragmas if pragmas is None else pragmas
+        install_pragmas(self.engine.sync_engine, self.pragmas)
+        self.statement_cache_stats = StatementCacheStats()
+        install_statement_cache_stats(
+            self.engine.sync_engine, self.statement_cache_stats
+        )
+        self.metrics = DatabaseMetrics()
+        install_database_metrics(self.engine.sync_engine, self.metrics, "async")
+        if slow_query_threshold is None:
+            slow_query_threshold = settings.SQLITE_SLOW_QUERY_THRESHOLD_MS / 1000
+        self.slow_queries = SlowQueryLog(slow_query_threshold)
+        install_slow_query_log(self.engine.sync_engine, self.slow_queries)
+        self._session_factory = async_sessionmaker(
+            bind=self.engine, autoflush=False, expire_on_commit=False
+        )
+        self._tables_created = False
+
+    @property
+    def connection(self) -> AsyncSession:
+        return self._session_factory()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        unit_of_work = current_async_unit_of_work.get()
+        if (
+            unit_of_work is not None
+            and unit_of_work.session_factory is self._session_factory
+        ):
+            yield await unit_of_work.get_session()
+            return
+        async with self._session_factory() as session:
+            yield session
+
+    def _write_unit_of_work(self) -> AsyncUnitOfWork | None:
+        unit_of_work = current_async_unit_of_work.get()
+        if (
+            unit_of_work is not None
+            and unit_of_work.write
+            and unit_of_work.session_factory is self._session_factory
+        ):
+            return unit_of_work
+        return None
+
+    async def commit(
+        self, session: AsyncSession, on_commit: Callable[[], None] | None = None
+    ) -> None:
+        unit_of_work = self._write_unit_of_work()
+        if unit_of_work is not None and unit_of_work.holds(session):
+            await session.flush()
+            if on_commit is not None:
+                unit_of_work.after_commit(on_commit)
+            return
+        await session.commit()
+        if on_commit is not None:
+            on_commit()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        unit_of_work = self._write_unit_of_work()
+        if unit_of_work is None:
+            callback()
+        else:
+            unit_of_work.after_commit(callback)
+
+    @asynccontextmanager
+    async def unit_of_work(
+        self, *, write: bool = False
+    ) -> AsyncIterator[AsyncUnitOfWork]:
+        unit_of_work = AsyncUnitOfWork(self._session_factory, write=write)
+        token = current_async_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+        except BaseException:
+            await unit_of_work.rollback()
+            raise
+        else:
+            await unit_of_work.commit()
+        finally:
+            await unit_of_work.close()
+            current_async_unit_of_work.reset(token)
+
+    async def create_tables(self) -> None:
+        if self._tables_created:
+            return
+        async with self.engine.begin() as connection:
+            await connection.run_sync(_create_schema)
+        self._tables_created = True
+
+    async def effective_pragmas(self) -> dict[str, str | int]:
+        async with self.engine.connect() as connection:
+            return await connection.run_sync(read_pragmas, self.pragmas)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
@@ -0,0 +1,192 @@
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from sqlalchemy.engine import Connection
+
+from book_api.domain.entities import Book
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.queries import changed_values
+from book_api.gateways.sqlite.repositories import (
+    SQLiteBookRepository,
+    delete_book,
+    insert_book,
+    update_book,
+)
+from book_api.gateways.sqlite.unit_of_work import begin_statement
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Callable[[Connection], Any]
+
+
+class GroupCommitWriterStopped(RuntimeError):
+    pass
+
+
+class GroupCommitTimeout(TimeoutError):
+    pass
+
+
+@dataclass
+class PendingWrite:
+    operation: WriteOperation
+    future: Future
+
+
+class GroupCommitWriter:
+    def __init__(
+        self,
+        database: Database,
+        generation: WriteGeneration,
+        max_batch: int = 64,
+        max_delay: float = 0.0,
+        timeout: float | None = 30.0,
+    ) -> None:
+        self.database = database
+        self.generation = generation
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._queue: queue.SimpleQueue[PendingWrite | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._failure: BaseException | None = None
+        self._inflight: list[PendingWrite] = []
+        self._lock = threading.Lock()
+
+    def submit(self, operation: WriteOperation) -> Any:
+        future: Future = Future()
+        # Checked and enqueued under the lock the dying writer drains with, so nothing is left unresolved.
+        with self._lock:
+            if self._failure is not None:
+                raise GroupCommitWriterStopped(
+                    "Group commit writer has stopped"
+                ) from self._failure
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="book-api-group-commit", daemon=True
+                )
+                self._thread.start()
+            self._queue.put(PendingWrite(operation, future))
+        # The timeout bounds how long a request thread can wait; the write itself may still commit later.
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError as error:
+            raise GroupCommitTimeout(
+                f"Write was not committed within {self.timeout:g}s; it may still be applied"
+            ) from error
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self) -> None:
+        try:
+            self._drain_batches()
+        except BaseException as error:
+            logger.critical("Group commit writer stopped", exc_info=True)
+            self._stop(error)
+
+    def _stop(self, error: BaseException) -> None:
+        with self._lock:
+            self._failure = error
+            self._thread = None
+            pending = list(self._inflight)
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    pending.append(item)
+        for item in pending:
+            if not item.future.done():
+                stopped = GroupCommitWriterStopped("Group commit writer has stopped")
+                stopped.__cause__ = error
+                item.future.set_exception(stopped)
+
+    def _drain_batches(self) -> None:
+        running = True
+        while running:
+            first = self._queue.get()
+            if first is None:
+                return
+            # Writes queued while the previous group committed join this one; max_delay can hold
+            # the group open a little longer to gather more.
+            batch = [first]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    pending = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if pending is None:
+                    running = False
+                    break
+                batch.append(pending)
+            self._inflight = batch
+            self._commit(batch)
+
+    def _commit(self, batch: list[PendingWrite]) -> None:
+        outcomes: list[tuple[PendingWrite, Any, BaseException | None]] = []
+        try:
+            with self.database.connection as session:
+                connection = session.connection()
+                connection.exec_driver_sql(begin_statement(write=True))
+                for pending in batch:
+                    # A savepoint per operation keeps one caller's failure out of the others' group.
+                    try:
+                        with session.begin_nested():
+                            outcomes.append(
+                                (pending, pending.operation(connection), None)
+                            )
+                    except Exception as error:
+                        outcomes.append((pending, None, error))
+                session.commit()
+        except Exception as error:
+            logger.exception("Group commit of %d writes failed", len(batch))
+            for pending in batch:
+                pending.future.set_exception(error)
+            return
+
+        # Savepoints that all rolled back leave the data as it was, so cached counts stay valid.
+        if any(error is None for _, _, error in outcomes):
+            self.generation.bump()
+        for pending, result, error in outcomes:
+            if error is not None:
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(result)
+
+
+@dataclass(kw_only=True)
+class GroupCommitBookRepository(SQLiteBookRepository):
+    writer: GroupCommitWriter
+
+    def create(self, *, title: str, author: str, year: int | None) -> Book:
+        return self.writer.submit(
+            partial(insert_book, title=title, author=author, year=year)
+        )
+
+    def update(
+        self, oid: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book | None:
+        values = changed_values(title=title, author=author, year=year)
+        if not values:
+            return self.get_by_id(oid)
+        return self.writer.submit(partial(update_book, oid=oid, values=values))
+
+    def delete(self, oid: int) -> bool:
+        return self.writer.submit(partial(delete_book, oid=oid))
@@ -0,0 +1,94 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from book_api.helpers.metrics import Gauge, Histogram
+
+STATEMENT_STARTED = "book_api_statement_started"
+
+
+class TimedQueuePool(QueuePool):
+    # Pool events fire only once a connection is handed out, so the wait is measured around _do_get.
+    checkout_wait: Callable[[float], None] | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.checkout_wait is not None:
+                self.checkout_wait(time.perf_counter() - started)
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait
+        return pool
+
+
+class TimedAsyncAdaptedQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+@dataclass
+class DatabaseMetrics:
+    statement_duration: Histogram = field(
+        default_factory=lambda: Histogram(
+            "book_api_db_statement_duration_seconds",
+            "Cursor execution time per statement type",
+            ("pool", "statement"),
+        )
+    )
+    checkout_wait: Histogram = field(
+        default_factory=lambda: Histogram(
+            "book_api_db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pooled connection",
+            ("pool",),
+        )
+    )
+    checked_out: Gauge = field(
+        default_factory=lambda: Gauge(
+            "book_api_db_pool_checked_out",
+            "Connections currently checked out of the pool",
+            ("pool",),
+        )
+    )
+    engines: dict[str, Engine] = field(default_factory=dict)
+
+    def collect(self) -> tuple[Histogram | Gauge, ...]:
+        for name, engine in self.engines.items():
+            self.checked_out.set(engine.pool.checkedout(), name)
+        return self.statement_duration, self.checkout_wait, self.checked_out
+
+
+def statement_kind(statement: str) -> str:
+    return statement.split(None, 1)[0].upper()
+
+
+def install_database_metrics(
+    engine: Engine, metrics: DatabaseMetrics, pool_name: str
+) -> None:
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.checkout_wait = lambda seconds: metrics.checkout_wait.observe(
+            seconds, pool_name
+        )
+        metrics.engines[pool_name] = engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_statement_timer(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info[STATEMENT_STARTED] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_statement_time(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        started = conn.info.pop(STATEMENT_STARTED, None)
+        if started is not None:
+            metrics.statement_duration.observe(
+                time.perf_counter() - started, pool_name, statement_kind(statement)
+            )
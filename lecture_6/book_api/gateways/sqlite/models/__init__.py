@@ -1 +1,2 @@
-from book_api.gateways.sqlite.models.book import * # noqa F403
\ No newline at end of file
+from book_api.gateways.sqlite.models.book import *  # noqa F403
+from book_api.gateways.sqlite.models.search import *  # noqa F403
@@ -1,3 +1,5 @@
+import sys
+
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -26,6 +28,15 @@ class BookORM(BaseORM):
         return Book(
             id=self.id if self.id is not None else 0,
             title=self.title,
-            author=self.author,
+            author=sys.intern(self.author),
             year=self.year,
         )
+
+
+# Read paths select these columns directly and skip building identity-mapped BookORM instances.
+BOOK_COLUMNS = (BookORM.id, BookORM.title, BookORM.author, BookORM.year)
+
+
+def book_from_row(row: sa.Row) -> Book:
+    # Authors repeat across many rows; interning lets cached and paged entities share one string.
+    return Book(id=row[0], title=row[1], author=sys.intern(row[2]), year=row[3])
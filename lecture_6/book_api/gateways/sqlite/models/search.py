@@ -0,0 +1,86 @@
+import re
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+from book_api.gateways.sqlite.models.book import BookORM
+
+BOOKS_FTS_TABLE = "books_fts"
+
+books_fts = sa.table(
+    BOOKS_FTS_TABLE, sa.column("rowid"), sa.column("title"), sa.column("author")
+)
+
+_SEARCH_INDEX_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {BOOKS_FTS_TABLE} USING fts5(
+        title,
+        author,
+        content='books',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {BOOKS_FTS_TABLE}_ai AFTER INSERT ON books BEGIN
+        INSERT INTO {BOOKS_FTS_TABLE}(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {BOOKS_FTS_TABLE}_ad AFTER DELETE ON books BEGIN
+        INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {BOOKS_FTS_TABLE}_au AFTER UPDATE OF title, author ON books BEGIN
+        INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO {BOOKS_FTS_TABLE}(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END
+    """,
+)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def search_index_exists(connection: Connection) -> bool:
+    query = sa.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+    return connection.execute(query, {"name": BOOKS_FTS_TABLE}).first() is not None
+
+
+def create_search_index(connection: Connection) -> None:
+    exists = search_index_exists(connection)
+    for statement in _SEARCH_INDEX_DDL:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    connection.exec_driver_sql(
+        f"INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}) VALUES ('rebuild')"
+    )
+
+
+def build_match_expression(text: str | None) -> str | None:
+    if not text:
+        return None
+    tokens = _TOKEN_PATTERN.findall(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def match_clause(expression: str):
+    return sa.literal_column(BOOKS_FTS_TABLE).op("MATCH")(expression)
+
+
+def bm25_rank():
+    return sa.func.bm25(sa.literal_column(BOOKS_FTS_TABLE))
+
+
+@sa.event.listens_for(BookORM.__table__, "after_create")
+def _create_search_index_after_books(target, connection: Connection, **kwargs) -> None:
+    create_search_index(connection)
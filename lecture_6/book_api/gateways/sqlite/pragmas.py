@@ -0,0 +1,23 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+def apply_pragmas(dbapi_connection, pragmas: dict[str, str | int]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas_on_connect(dbapi_connection, connection_record) -> None:
+        apply_pragmas(dbapi_connection, pragmas)
+
+
+def read_pragmas(connection: Connection, names) -> dict[str, str | int]:
+    return {
+        name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names
+    }
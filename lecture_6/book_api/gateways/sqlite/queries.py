@@ -0,0 +1,212 @@
+from collections.abc import Iterator
+from functools import cache
+from typing import Any, NamedTuple
+
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Integer,
+    Select,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+
+from book_api.domain.errors import InvalidSearchQuery, UnsupportedPagination
+from book_api.gateways.sqlite.models import (
+    BOOK_COLUMNS,
+    BookORM,
+    bm25_rank,
+    books_fts,
+    build_match_expression,
+    match_clause,
+)
+
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def chunked(values: list, size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[list]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class BoundQuery(NamedTuple):
+    statement: Select
+    params: dict[str, Any]
+
+
+def filter_params(
+    title: str | None, author: str | None, year: int | None, text: str | None = None
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+    match_expression = build_match_expression(text)
+    if match_expression:
+        params["match"] = match_expression
+    elif text:
+        # Dropping the MATCH filter would turn an unusable query into the whole catalog.
+        raise InvalidSearchQuery("Search query has no searchable words")
+    if title:
+        params["title"] = f"%{title}%"
+    if author:
+        params["author"] = f"%{author}%"
+    if year is not None:
+        params["year"] = year
+    return params
+
+
+# Statements are built once per filter combination with bound parameters, so repeated
+# searches reuse the same construct, its memoized cache key and the compiled SQL.
+@cache
+def filtered_statement(filters: frozenset[str]) -> Select:
+    query = select(*BOOK_COLUMNS)
+    if "match" in filters:
+        query = query.join(books_fts, books_fts.c.rowid == BookORM.id).where(
+            match_clause(bindparam("match"))
+        )
+    if "title" in filters:
+        query = query.where(BookORM.title.ilike(bindparam("title")))
+    if "author" in filters:
+        query = query.where(BookORM.author.ilike(bindparam("author")))
+    if "year" in filters:
+        query = query.where(BookORM.year == bindparam("year"))
+    return query
+
+
+@cache
+def page_statement(filters: frozenset[str], keyset: bool) -> Select:
+    if keyset and "match" in filters:
+        # An id cursor only pages correctly under id order; ranked results would skip or repeat rows.
+        raise UnsupportedPagination(
+            "Cursor pagination is not supported for full-text search"
+        )
+    query = filtered_statement(filters)
+    if "match" in filters:
+        query = query.order_by(bm25_rank(), BookORM.id)
+    else:
+        query = query.order_by(BookORM.id)
+    if keyset:
+        query = query.where(BookORM.id > bindparam("after_id"))
+    else:
+        query = query.offset(bindparam("offset", type_=Integer))
+    return query.limit(bindparam("limit", type_=Integer))
+
+
+@cache
+def count_statement(filters: frozenset[str]) -> Select:
+    return select(func.count()).select_from(filtered_statement(filters).subquery())
+
+
+@cache
+def page_with_total_statement(
+    filters: frozenset[str], keyset: bool, include_total: bool
+) -> Select:
+    query = page_statement(filters, keyset)
+    if include_total and not keyset and "match" not in filters:
+        # The window is evaluated before LIMIT, so it sees every filtered row.
+        query = query.add_columns(func.count().over().label("total"))
+    elif include_total:
+        # A keyset predicate would hide earlier rows from the window and bm25() cannot run
+        # inside a windowed select, so these modes count the filter in a scalar subquery.
+        query = query.add_columns(
+            count_statement(filters).scalar_subquery().label("total")
+        )
+    return query
+
+
+@cache
+def export_statement(filters: frozenset[str]) -> Select:
+    return filtered_statement(filters).order_by(BookORM.id)
+
+
+def paging_params(
+    params: dict[str, Any], *, offset: int, limit: int, after_id: int | None
+) -> dict[str, Any]:
+    if after_id is not None:
+        return {**params, "after_id": after_id, "limit": limit}
+    return {**params, "offset": offset, "limit": limit}
+
+
+def page_query(
+    title: str | None,
+    author: str | None,
+    year: int | None,
+    text: str | None,
+    *,
+    offset: int,
+    limit: int,
+    after_id: int | None,
+) -> BoundQuery:
+    params = filter_params(title, author, year, text)
+    statement = page_statement(frozenset(params), after_id is not None)
+    return BoundQuery(
+        statement, paging_params(params, offset=offset, limit=limit, after_id=after_id)
+    )
+
+
+def export_query(
+    title: str | None, author: str | None, year: int | None, text: str | None = None
+) -> BoundQuery:
+    params = filter_params(title, author, year, text)
+    return BoundQuery(export_statement(frozenset(params)), params)
+
+
+def count_query(
+    title: str | None, author: str | None, year: int | None, text: str | None = None
+) -> BoundQuery:
+    params = filter_params(title, author, year, text)
+    return BoundQuery(count_statement(frozenset(params)), params)
+
+
+def page_with_total_query(
+    title: str | None,
+    author: str | None,
+    year: int | None,
+    text: str | None,
+    *,
+    offset: int,
+    limit: int,
+    after_id: int | None,
+    include_total: bool,
+) -> BoundQuery:
+    params = filter_params(title, author, year, text)
+    statement = page_with_total_statement(
+        frozenset(params), after_id is not None, include_total
+    )
+    # One extra row tells whether another page exists without counting.
+    return BoundQuery(
+        statement,
+        paging_params(params, offset=offset, limit=limit + 1, after_id=after_id),
+    )
+
+
+def needs_count_fallback(rows: list, *, offset: int, after_id: int | None) -> bool:
+    return not rows and (offset > 0 or after_id is not None)
+
+
+BOOK_BY_ID_STATEMENT = select(*BOOK_COLUMNS).where(BookORM.id == bindparam("id"))
+
+
+def book_by_id_query(oid: int) -> BoundQuery:
+    return BoundQuery(BOOK_BY_ID_STATEMENT, {"id": oid})
+
+
+def changed_values(**values: Any) -> dict[str, Any]:
+    return {name: value for name, value in values.items() if value is not None}
+
+
+def insert_books_query() -> Insert:
+    return insert(BookORM).returning(*BOOK_COLUMNS)
+
+
+def update_book_query(oid: int, values: dict[str, Any]) -> Update:
+    return (
+        update(BookORM).where(BookORM.id == oid).values(values).returning(*BOOK_COLUMNS)
+    )
+
+
+def delete_book_query(oid: int) -> Delete:
+    return delete(BookORM).where(BookORM.id == oid).returning(BookORM.id)
@@ -1,21 +1,52 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
-from book_api.domain.entities import Book
+from book_api.domain.entities import Book, BookPage
+from book_api.gateways.sqlite.caching import (
+    CountCache,
+    WriteGeneration,
+    count_cache_key,
+)
 from book_api.gateways.sqlite.database import Database
-from book_api.gateways.sqlite.models import BookORM
+from book_api.gateways.sqlite.models import BookORM, book_from_row
+from book_api.gateways.sqlite.queries import (
+    book_by_id_query,
+    changed_values,
+    chunked,
+    count_query,
+    delete_book_query,
+    export_query,
+    insert_books_query,
+    needs_count_fallback,
+    page_query,
+    page_with_total_query,
+    update_book_query,
+)
 
 
 @dataclass
 class IBookRepository(ABC):
     database: Database
+    generation: WriteGeneration = field(default_factory=WriteGeneration)
+    count_cache: CountCache = field(default_factory=CountCache)
 
     @property
-    def session(self) -> Session:
-        return self.database.connection
+    def session(self) -> AbstractContextManager[Session]:
+        return self.database.session_scope()
+
+    @property
+    def read_session(self) -> AbstractContextManager[Session]:
+        return self.database.read_scope()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.database.after_commit(callback)
 
     @abstractmethod
     def get_by_id(self, oid: int) -> Book | None:
@@ -26,7 +57,9 @@ class IBookRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, oid: int, *, title: str | None, author: str | None, year: int | None) -> Book | None:
+    def update(
+        self, oid: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book | None:
         raise NotImplementedError
 
     @abstractmethod
@@ -34,71 +67,268 @@ class IBookRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def find_many(self, *, title: str | None, author: str | None, year: int | None, offset: int, limit: int) -> list[Book]:
+    def find_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+    ) -> list[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        text: str | None = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_page(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_many(self, rows: list[dict[str, Any]]) -> list[Book]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, rows: list[dict[str, Any]]) -> list[Book]:
         raise NotImplementedError
 
     @abstractmethod
-    def count_many(self, *, title: str | None, author: str | None, year: int | None) -> int:
+    def delete_many(self, oids: list[int]) -> list[int]:
         raise NotImplementedError
 
 
+def insert_book(
+    connection: Connection, *, title: str, author: str, year: int | None
+) -> Book:
+    row = connection.execute(
+        insert_books_query(), {"title": title, "author": author, "year": year}
+    ).one()
+    return book_from_row(row)
+
+
+def update_book(
+    connection: Connection, oid: int, values: dict[str, Any]
+) -> Book | None:
+    row = connection.execute(update_book_query(oid, values)).first()
+    return book_from_row(row) if row else None
+
+
+def delete_book(connection: Connection, oid: int) -> bool:
+    return connection.execute(delete_book_query(oid)).scalar() is not None
+
+
 @dataclass
 class SQLiteBookRepository(IBookRepository):
-    def _filtered_query(self, title: str | None, author: str | None, year: int | None):
-        query = select(BookORM)
-        if title:
-            query = query.where(BookORM.title.ilike(f"%{title}%"))
-        if author:
-            query = query.where(BookORM.author.ilike(f"%{author}%"))
-        if year is not None:
-            query = query.where(BookORM.year == year)
-        return query
-
     def get_by_id(self, oid: int) -> Book | None:
-        with self.session as session:
-            book = session.get(BookORM, oid)
-            return book.to_entity() if book else None
+        with self.read_session as session:
+            row = session.connection().execute(*book_by_id_query(oid)).first()
+            return book_from_row(row) if row else None
 
     def create(self, *, title: str, author: str, year: int | None) -> Book:
         with self.session as session:
-            book = BookORM(title=title, author=author, year=year)
-            session.add(book)
-            session.commit()
-            session.refresh(book)
-            return book.to_entity()
+            book = insert_book(
+                session.connection(), title=title, author=author, year=year
+            )
+            self.database.commit(session, self.generation.bump)
+            return book
 
-    def update(self, oid: int, *, title: str | None, author: str | None, year: int | None) -> Book | None:
+    def update(
+        self, oid: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book | None:
+        values = changed_values(title=title, author=author, year=year)
+        if not values:
+            return self.get_by_id(oid)
         with self.session as session:
-            book = session.get(BookORM, oid)
-            if not book:
-                return None
-            if title is not None:
-                book.title = title
-            if author is not None:
-                book.author = author
-            if year is not None:
-                book.year = year
-            session.commit()
-            session.refresh(book)
-            return book.to_entity()
+            book = update_book(session.connection(), oid, values)
+            self.database.commit(
+                session, self.generation.bump if book is not None else None
+            )
+            return book
 
     def delete(self, oid: int) -> bool:
         with self.session as session:
-            book = session.get(BookORM, oid)
-            if not book:
-                return False
-            session.delete(book)
-            session.commit()
-            return True
-
-    def find_many(self, *, title: str | None, author: str | None, year: int | None, offset: int, limit: int) -> list[Book]:
+            deleted = delete_book(session.connection(), oid)
+            self.database.commit(session, self.generation.bump if deleted else None)
+            return deleted
+
+    def find_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+    ) -> list[Book]:
+        with self.read_session as session:
+            query = page_query(
+                title, author, year, text, offset=offset, limit=limit, after_id=after_id
+            )
+            return [book_from_row(row) for row in session.connection().execute(*query)]
+
+    def count_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        text: str | None = None,
+    ) -> int:
+        key = count_cache_key(self.generation.value, title, author, year, text)
+        found, total = self.count_cache.get(key)
+        if found:
+            return total
+        with self.read_session as session:
+            total = (
+                session.connection()
+                .execute(*count_query(title, author, year, text))
+                .scalar_one()
+            )
+        self.count_cache.set(key, total)
+        return total
+
+    def find_page(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        key = count_cache_key(self.generation.value, title, author, year, text)
+        found, total = self.count_cache.get(key) if include_total else (False, None)
+        query = page_with_total_query(
+            title,
+            author,
+            year,
+            text,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            include_total=include_total and not found,
+        )
+        with self.read_session as session:
+            rows = session.connection().execute(*query).all()
+            if include_total and not found:
+                if rows:
+                    total = rows[0].total
+                elif needs_count_fallback(rows, offset=offset, after_id=after_id):
+                    total = (
+                        session.connection()
+                        .execute(*count_query(title, author, year, text))
+                        .scalar_one()
+                    )
+                else:
+                    total = 0
+                self.count_cache.set(key, total)
+
+            books = [book_from_row(row) for row in rows[:limit]]
+            return BookPage(items=books, total=total, has_more=len(rows) > limit)
+
+    def iter_many(
+        self,
+        *,
+        title: str | None,
+        author: str | None,
+        year: int | None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        query = export_query(title, author, year, text)
+        with self.read_session as session:
+            for row in session.connection().execute(
+                *query, execution_options={"yield_per": batch_size}
+            ):
+                yield book_from_row(row)
+
+    def create_many(self, rows: list[dict[str, Any]]) -> list[Book]:
+        if not rows:
+            return []
+        with self.session as session:
+            books = [
+                book_from_row(row)
+                for row in session.connection().execute(insert_books_query(), rows)
+            ]
+            self.database.commit(session, self.generation.bump)
+            # RETURNING order is unspecified, but rowids are handed out in parameter order.
+            return sorted(books, key=lambda book: book.id)
+
+    def update_many(self, rows: list[dict[str, Any]]) -> list[Book]:
+        if not rows:
+            return []
         with self.session as session:
-            query = self._filtered_query(title, author, year).order_by(BookORM.id).offset(offset).limit(limit)
-            books = session.scalars(query).all()
-            return [b.to_entity() for b in books if b]
+            requested_ids = list(dict.fromkeys(row["id"] for row in rows))
+            existing_ids: set[int] = set()
+            for ids in chunked(requested_ids):
+                existing_ids.update(
+                    session.scalars(select(BookORM.id).where(BookORM.id.in_(ids)))
+                )
+
+            changes = [
+                row for row in rows if row["id"] in existing_ids and len(row) > 1
+            ]
+            if changes:
+                session.execute(update(BookORM), changes)
+
+            books: list[Book] = []
+            for ids in chunked(sorted(existing_ids)):
+                query = select(BookORM).where(BookORM.id.in_(ids)).order_by(BookORM.id)
+                books.extend(book.to_entity() for book in session.scalars(query))
+            self.database.commit(session, self.generation.bump if changes else None)
+            return books
 
-    def count_many(self, *, title: str | None, author: str | None, year: int | None) -> int:
+    def delete_many(self, oids: list[int]) -> list[int]:
+        if not oids:
+            return []
         with self.session as session:
-            query = self._filtered_query(title, author, year)
-            count_query = select(func.count()).select_from(query.subquery())
-            return session.execute(count_query).scalar_one()
+            deleted_ids: list[int] = []
+            for ids in chunked(list(dict.fromkeys(oids))):
+                statement = (
+                    delete(BookORM)
+                    .where(BookORM.id.in_(ids))
+                    .returning(BookORM.id)
+                    .execution_options(synchronize_session=False)
+                )
+                deleted_ids.extend(session.scalars(statement))
+            self.database.commit(session, self.generation.bump if deleted_ids else None)
+            return deleted_ids
@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from book_api.gateways.sqlite.metrics import statement_kind
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_STARTED = "book_api_slow_query_started"
+EXPLAINABLE_STATEMENTS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+MAX_PARAMETERS_LENGTH = 500
+
+
+@dataclass
+class SlowStatement:
+    statement: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    last_parameters: str = ""
+    plan: tuple[str, ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": self.total_time * 1000,
+            "mean_ms": self.total_time * 1000 / self.count,
+            "max_ms": self.max_time * 1000,
+            "last_parameters": self.last_parameters,
+            "plan": list(self.plan),
+        }
+
+
+def format_plan(rows) -> tuple[str, ...]:
+    # EXPLAIN QUERY PLAN rows are (id, parent, notused, detail); indent each detail under its parent.
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return tuple(lines)
+
+
+def format_parameters(parameters: Any) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        return text[:MAX_PARAMETERS_LENGTH] + "..."
+    return text
+
+
+class SlowQueryLog:
+    def __init__(self, threshold: float, max_statements: int = 200) -> None:
+        self.threshold = threshold
+        self.max_statements = max_statements
+        self._statements: dict[str, SlowStatement] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        explain: Callable[[], tuple[str, ...]],
+    ) -> SlowStatement:
+        # Statements use bound parameters, so the SQL text is the statement shape.
+        with self._lock:
+            entry = self._statements.get(statement)
+            needs_plan = entry is None
+        plan = explain() if needs_plan else ()
+
+        with self._lock:
+            entry = self._statements.get(statement)
+            if entry is None:
+                if len(self._statements) >= self.max_statements:
+                    cheapest = min(
+                        self._statements.values(), key=lambda slow: slow.total_time
+                    )
+                    del self._statements[cheapest.statement]
+                entry = self._statements[statement] = SlowStatement(
+                    statement=statement, plan=plan
+                )
+            entry.count += 1
+            entry.total_time += duration
+            entry.max_time = max(entry.max_time, duration)
+            entry.last_parameters = format_parameters(parameters)
+
+        logger.warning(
+            "Slow query (%.1f ms): %s\nparameters: %s\nplan:\n%s",
+            duration * 1000,
+            statement,
+            entry.last_parameters,
+            "\n".join(entry.plan) or "(unavailable)",
+        )
+        return entry
+
+    def top(self, limit: int = 20) -> list[dict[str, Any]]:
+        with self._lock:
+            statements = sorted(
+                self._statements.values(),
+                key=lambda slow: slow.total_time,
+                reverse=True,
+            )
+            return [slow.as_dict() for slow in statements[:limit]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+
+def explain_query_plan(conn, statement: str, parameters: Any) -> tuple[str, ...]:
+    # DDL and PRAGMA have no plan, and re-preparing DDL after it ran only reports that it already did.
+    if statement_kind(statement) not in EXPLAINABLE_STATEMENTS:
+        return ()
+    # A raw cursor keeps the EXPLAIN out of the engine events, so it is neither timed nor logged.
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return format_plan(cursor.fetchall())
+    except Exception as error:
+        return (f"EXPLAIN QUERY PLAN failed: {error}",)
+    finally:
+        cursor.close()
+
+
+def install_slow_query_log(engine: Engine, slow_queries: SlowQueryLog) -> None:
+    if not slow_queries.enabled:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_slow_query_timer(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info[SLOW_QUERY_STARTED] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_slow_query(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        started = conn.info.pop(SLOW_QUERY_STARTED, None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+        if duration < slow_queries.threshold:
+            return
+        sample = parameters[0] if executemany and parameters else parameters
+        slow_queries.record(
+            statement,
+            sample,
+            duration,
+            lambda: explain_query_plan(conn, statement, sample),
+        )
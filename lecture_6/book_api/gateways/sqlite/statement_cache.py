@@ -0,0 +1,44 @@
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+
+@dataclass
+class StatementCacheStats:
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record(self, cache_hit: Any) -> None:
+        with self._lock:
+            if cache_hit is CACHE_HIT:
+                self.hits += 1
+            elif cache_hit is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.uncached += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+def install_statement_cache_stats(engine: Engine, stats: StatementCacheStats) -> None:
+    @event.listens_for(engine, "after_execute")
+    def _record_cache_hit(
+        conn, clauseelement, multiparams, params, execution_options, result
+    ) -> None:
+        # Driver-level SQL (BEGIN, PRAGMA) never reaches the compiled cache and counts as uncached.
+        stats.record(result.context.cache_hit)
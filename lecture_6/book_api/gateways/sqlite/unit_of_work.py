@@ -0,0 +1,102 @@
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+def begin_statement(write: bool) -> str:
+    # pysqlite only opens a transaction before DML, so reads need an explicit BEGIN to share
+    # one snapshot; writers take the lock up front instead of failing a later upgrade.
+    return "BEGIN IMMEDIATE" if write else "BEGIN"
+
+
+def run_callbacks(callbacks: list[Callable[[], None]]) -> None:
+    pending = list(callbacks)
+    callbacks.clear()
+    for callback in pending:
+        callback()
+
+
+@dataclass
+class UnitOfWork:
+    session_factory: Callable[[], Session]
+    write: bool = False
+    _session: Session | None = field(default=None, init=False)
+    _on_commit: list[Callable[[], None]] = field(default_factory=list, init=False)
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self.session_factory()
+            self._session.connection().exec_driver_sql(begin_statement(self.write))
+        return self._session
+
+    def holds(self, session: Session) -> bool:
+        return session is self._session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._on_commit.append(callback)
+
+    def commit(self) -> None:
+        if self._session is not None:
+            self._session.commit()
+        run_callbacks(self._on_commit)
+
+    def rollback(self) -> None:
+        self._on_commit.clear()
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        self._on_commit.clear()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+@dataclass
+class AsyncUnitOfWork:
+    session_factory: Callable[[], AsyncSession]
+    write: bool = False
+    _session: AsyncSession | None = field(default=None, init=False)
+    _on_commit: list[Callable[[], None]] = field(default_factory=list, init=False)
+
+    async def get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.session_factory()
+            connection = await self._session.connection()
+            await connection.exec_driver_sql(begin_statement(self.write))
+        return self._session
+
+    def holds(self, session: AsyncSession) -> bool:
+        return session is self._session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._on_commit.append(callback)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+        run_callbacks(self._on_commit)
+
+    async def rollback(self) -> None:
+        self._on_commit.clear()
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        self._on_commit.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+current_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "current_unit_of_work", default=None
+)
+current_async_unit_of_work: ContextVar[AsyncUnitOfWork | None] = ContextVar(
+    "current_async_unit_of_work",
+    default=None,
+)
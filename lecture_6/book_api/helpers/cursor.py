@@ -0,0 +1,20 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(book_id: int) -> str:
+    payload = json.dumps({"id": book_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        book_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as error:
+        raise ValueError("Malformed cursor") from error
+    if not isinstance(book_id, int) or isinstance(book_id, bool):
+        raise ValueError("Malformed cursor")
+    return book_id
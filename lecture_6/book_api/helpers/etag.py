@@ -0,0 +1,25 @@
+import hashlib
+
+from book_api.domain.entities import Book, BookPage
+
+
+def _digest(*parts) -> str:
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def book_etag(book: Book) -> str:
+    return _digest(book.id, book.title, book.author, book.year)
+
+
+def page_etag(page: BookPage, generation: int, *context) -> str:
+    items = tuple((book.id, book.title, book.author, book.year) for book in page.items)
+    return _digest(generation, page.total, page.has_more, items, context)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    }
+    return "*" in candidates or etag in candidates
@@ -0,0 +1,154 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(
+    names: tuple[str, ...], values: tuple[str, ...], extra: str = ""
+) -> str:
+    pairs = [
+        f'{name}="{escape_label(value)}"'
+        for name, value in zip(names, values, strict=True)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        # Buckets are stored per slot and only accumulated on render, so an observation is one increment.
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = _HistogramSeries(
+                    len(self.buckets) + 1
+                )
+            series.counts[index] += 1
+            series.total += value
+
+    def header(self) -> tuple[str, str]:
+        return (
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        )
+
+    def render(self) -> Iterator[str]:
+        yield from self.header()
+        yield from self.samples()
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            series = [
+                (labels, list(entry.counts), entry.total)
+                for labels, entry in self._series.items()
+            ]
+        for labels, counts, total in sorted(series):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                bucket_labels = format_labels(
+                    self.label_names, labels, f'le="{format_value(bound)}"'
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{format_labels(self.label_names, labels)} {format_value(total)}"
+            yield f"{self.name}_count{format_labels(self.label_names, labels)} {cumulative}"
+
+
+class Gauge:
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, amount: float = 1, *label_values: str) -> None:
+        self.inc(-amount, *label_values)
+
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def header(self) -> tuple[str, str]:
+        return f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"
+
+    def render(self) -> Iterator[str]:
+        yield from self.header()
+        yield from self.samples()
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{format_labels(self.label_names, labels)} {format_value(value)}"
+
+
+def render_metrics(metrics: Iterable[Histogram | Gauge]) -> str:
+    # Several sources (the sync and async databases) can report the same family; the exposition
+    # format allows one HELP/TYPE block per name, so their samples are grouped under it.
+    families: dict[str, list[Histogram | Gauge]] = {}
+    for metric in metrics:
+        families.setdefault(metric.name, []).append(metric)
+    lines = []
+    for family in families.values():
+        lines.extend(family[0].header())
+        for metric in family:
+            lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
@@ -1,10 +1,19 @@
+import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from book_api.presentation.api.v1.router import api_router
+from book_api.core.configs import settings
 from book_api.core.container import get_container
-from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.coherence import DataVersionMonitor
+from book_api.gateways.sqlite.database import AsyncDatabase, Database
+from book_api.gateways.sqlite.group_commit import GroupCommitTimeout, GroupCommitWriter
+from book_api.presentation.api.metrics import HttpMetrics, MetricsMiddleware
+from book_api.presentation.api.v1.router import build_api_router
+
+# uvicorn's default config only emits INFO through its own loggers, so the startup profile goes there.
+logger = logging.getLogger("uvicorn.error")
 
 
 @asynccontextmanager
@@ -12,13 +21,52 @@ async def lifespan(app: FastAPI):
     container = get_container()
     db = container.resolve(Database)
     db.create_tables()
+    logger.info("SQLite profile: %s", db.effective_pragmas())
+    monitor = (
+        container.resolve(DataVersionMonitor) if settings.is_multi_worker else None
+    )
+    async_db = None
+    if app.state.io_mode == "async":
+        async_db = container.resolve(AsyncDatabase)
+        await async_db.create_tables()
+        logger.info("SQLite async profile: %s", await async_db.effective_pragmas())
     yield
+    if async_db is not None:
+        await async_db.close()
+    container.resolve(GroupCommitWriter).close()
+    if monitor is not None:
+        monitor.close()
     db.close()
 
 
-def web_app_factory() -> FastAPI:
-    app = FastAPI(title="Book API Gateway", lifespan=lifespan)
-    app.include_router(api_router)
+async def write_timeout_handler(
+    request: Request, error: GroupCommitTimeout
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"detail": str(error)}
+    )
+
+
+def web_app_factory(
+    io_mode: str | None = None,
+    fast_json: bool | None = None,
+    metrics: bool | None = None,
+) -> FastAPI:
+    io_mode = io_mode or settings.BOOK_API_IO_MODE
+    fast_json = settings.BOOK_API_FAST_JSON if fast_json is None else fast_json
+    metrics = settings.BOOK_API_METRICS_ENABLED if metrics is None else metrics
+    app = FastAPI(
+        title="Book API Gateway",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse if fast_json else JSONResponse,
+    )
+    app.state.io_mode = io_mode
+    app.state.fast_json = fast_json
+    app.state.http_metrics = HttpMetrics() if metrics else None
+    if metrics:
+        app.add_middleware(MetricsMiddleware, metrics=app.state.http_metrics)
+    app.add_exception_handler(GroupCommitTimeout, write_timeout_handler)
+    app.include_router(build_api_router(io_mode))
     return app
 
 
@@ -0,0 +1,76 @@
+import time
+from dataclasses import dataclass, field
+
+from anyio.to_thread import current_default_thread_limiter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from book_api.helpers.metrics import Gauge, Histogram
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class HttpMetrics:
+    request_duration: Histogram = field(
+        default_factory=lambda: Histogram(
+            "book_api_http_request_duration_seconds",
+            "Request latency by route template",
+            ("method", "route", "status"),
+        )
+    )
+    in_flight: Gauge = field(
+        default_factory=lambda: Gauge(
+            "book_api_http_requests_in_flight", "Requests currently being served"
+        )
+    )
+    threadpool: Gauge = field(
+        default_factory=lambda: Gauge(
+            "book_api_threadpool_threads",
+            "Worker threads of the sync view threadpool",
+            ("state",),
+        )
+    )
+
+    def __post_init__(self) -> None:
+        self.in_flight.set(0)
+
+    def collect(self) -> tuple[Histogram | Gauge, ...]:
+        # Read on the event loop; busy == total means sync views are queueing for a thread.
+        limiter = current_default_thread_limiter()
+        self.threadpool.set(limiter.borrowed_tokens, "busy")
+        self.threadpool.set(limiter.total_tokens, "total")
+        return self.request_duration, self.in_flight, self.threadpool
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: HttpMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope; templates keep label cardinality bounded.
+            route = scope.get("route")
+            self.metrics.request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                str(status),
+            )
+            self.metrics.in_flight.dec()
@@ -1,13 +1,66 @@
-from fastapi import Depends
+from collections.abc import AsyncIterator
 
-from book_api.core.container import get_container
+from fastapi import Depends, Request
+
+from book_api.application.services.cached import BookCache
 from book_api.application.use_cases import (
+    AsyncCreateBookUseCase,
+    AsyncDeleteBookUseCase,
+    AsyncGetBookListUseCase,
+    AsyncGetBookUseCase,
+    AsyncUpdateBookUseCase,
+    BulkCreateBooksUseCase,
+    BulkDeleteBooksUseCase,
+    BulkUpdateBooksUseCase,
     CreateBookUseCase,
     DeleteBookUseCase,
+    ExportBooksUseCase,
     GetBookListUseCase,
     GetBookUseCase,
     UpdateBookUseCase,
 )
+from book_api.core.configs import settings
+from book_api.core.container import get_container
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.coherence import DataVersionMonitor
+from book_api.gateways.sqlite.database import AsyncDatabase, Database
+from book_api.gateways.sqlite.metrics import DatabaseMetrics
+from book_api.gateways.sqlite.slow_queries import SlowQueryLog
+from book_api.gateways.sqlite.statement_cache import StatementCacheStats
+from book_api.gateways.sqlite.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from book_api.presentation.api.metrics import HttpMetrics
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def sync_worker_caches(container=Depends(get_container)) -> None:
+    # Other workers' commits are only visible through the database; one PRAGMA per request keeps
+    # this process's caches and ETags from serving what they replaced.
+    if settings.is_multi_worker:
+        container.resolve(DataVersionMonitor).sync()
+
+
+async def get_unit_of_work(
+    request: Request, container=Depends(get_container)
+) -> AsyncIterator[UnitOfWork]:
+    # Grouped writes commit on the writer thread, so the request must not hold the write lock itself.
+    write = (
+        request.method not in READ_METHODS and not settings.SQLITE_GROUP_COMMIT_ENABLED
+    )
+    # Async so the context variable is set in the request task and inherited by threadpool views.
+    with container.resolve(Database).unit_of_work(write=write) as unit_of_work:
+        yield unit_of_work
+
+
+async def get_async_unit_of_work(
+    request: Request,
+    container=Depends(get_container),
+) -> AsyncIterator[AsyncUnitOfWork]:
+    database = container.resolve(AsyncDatabase)
+    async with database.unit_of_work(
+        write=request.method not in READ_METHODS
+    ) as unit_of_work:
+        yield unit_of_work
 
 
 def get_create_book_use_case(container=Depends(get_container)) -> CreateBookUseCase:
@@ -28,3 +81,94 @@ def get_delete_book_use_case(container=Depends(get_container)) -> DeleteBookUseC
 
 def get_list_book_use_case(container=Depends(get_container)) -> GetBookListUseCase:
     return container.resolve(GetBookListUseCase)
+
+
+def get_export_books_use_case(container=Depends(get_container)) -> ExportBooksUseCase:
+    return container.resolve(ExportBooksUseCase)
+
+
+def get_bulk_create_books_use_case(
+    container=Depends(get_container),
+) -> BulkCreateBooksUseCase:
+    return container.resolve(BulkCreateBooksUseCase)
+
+
+def get_bulk_update_books_use_case(
+    container=Depends(get_container),
+) -> BulkUpdateBooksUseCase:
+    return container.resolve(BulkUpdateBooksUseCase)
+
+
+def get_bulk_delete_books_use_case(
+    container=Depends(get_container),
+) -> BulkDeleteBooksUseCase:
+    return container.resolve(BulkDeleteBooksUseCase)
+
+
+def get_async_create_book_use_case(
+    container=Depends(get_container),
+) -> AsyncCreateBookUseCase:
+    return container.resolve(AsyncCreateBookUseCase)
+
+
+def get_async_get_book_use_case(
+    container=Depends(get_container),
+) -> AsyncGetBookUseCase:
+    return container.resolve(AsyncGetBookUseCase)
+
+
+def get_async_update_book_use_case(
+    container=Depends(get_container),
+) -> AsyncUpdateBookUseCase:
+    return container.resolve(AsyncUpdateBookUseCase)
+
+
+def get_async_delete_book_use_case(
+    container=Depends(get_container),
+) -> AsyncDeleteBookUseCase:
+    return container.resolve(AsyncDeleteBookUseCase)
+
+
+def get_async_list_book_use_case(
+    container=Depends(get_container),
+) -> AsyncGetBookListUseCase:
+    return container.resolve(AsyncGetBookListUseCase)
+
+
+def get_book_cache(container=Depends(get_container)) -> BookCache:
+    return container.resolve(BookCache)
+
+
+def get_write_generation(container=Depends(get_container)) -> WriteGeneration:
+    return container.resolve(WriteGeneration)
+
+
+def get_statement_cache_stats(
+    request: Request, container=Depends(get_container)
+) -> StatementCacheStats:
+    database = AsyncDatabase if request.app.state.io_mode == "async" else Database
+    return container.resolve(database).statement_cache_stats
+
+
+def get_slow_query_log(
+    request: Request, container=Depends(get_container)
+) -> SlowQueryLog:
+    database = AsyncDatabase if request.app.state.io_mode == "async" else Database
+    return container.resolve(database).slow_queries
+
+
+def get_database_metrics(
+    request: Request, container=Depends(get_container)
+) -> list[DatabaseMetrics]:
+    metrics = [container.resolve(Database).metrics]
+    if request.app.state.io_mode == "async":
+        metrics.append(container.resolve(AsyncDatabase).metrics)
+    return metrics
+
+
+def get_http_metrics(request: Request) -> HttpMetrics | None:
+    return request.app.state.http_metrics
+
+
+def get_fast_json(request: Request) -> bool:
+    return request.app.state.fast_json
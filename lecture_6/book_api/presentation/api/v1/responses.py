@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+
+from book_api.domain.entities import Book
+
+
+def book_payload(book: Book) -> dict[str, Any]:
+    return {
+        "id": book.id,
+        "title": book.title,
+        "author": book.author,
+        "year": book.year,
+    }
+
+
+def fast_response(
+    data: Any, response: Response, status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    # Mirrors ApiResponse; the payload is built from already-validated entities, so response_model is skipped.
+    return ORJSONResponse(
+        content={"data": data, "meta": {}, "errors": []},
+        status_code=status_code,
+        headers=dict(response.headers),
+    )
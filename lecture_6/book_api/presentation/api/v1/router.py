@@ -1,9 +1,42 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from book_api.presentation.api.v1.views import books
-from book_api.presentation.api.v1.views import healthcheck
+from book_api.presentation.api.v1.dependencies import (
+    get_async_unit_of_work,
+    get_unit_of_work,
+    sync_worker_caches,
+)
+from book_api.presentation.api.v1.views import (
+    books,
+    books_async,
+    bulk,
+    debug,
+    exports,
+    healthcheck,
+    imports,
+    metrics,
+)
 
 
-api_router = APIRouter()
-api_router.include_router(books.router, prefix="/books", tags=["books"])
-api_router.include_router(healthcheck.router, tags=["healthcheck"])
+def build_api_router(io_mode: str = "sync") -> APIRouter:
+    books_router = books_async.router if io_mode == "async" else books.router
+    unit_of_work = get_async_unit_of_work if io_mode == "async" else get_unit_of_work
+
+    router = APIRouter(dependencies=[Depends(sync_worker_caches)])
+    router.include_router(
+        bulk.router,
+        prefix="/books",
+        tags=["books"],
+        dependencies=[Depends(get_unit_of_work)],
+    )
+    router.include_router(exports.router, prefix="/books", tags=["books"])
+    router.include_router(imports.router, prefix="/books", tags=["books"])
+    router.include_router(
+        books_router,
+        prefix="/books",
+        tags=["books"],
+        dependencies=[Depends(unit_of_work)],
+    )
+    router.include_router(healthcheck.router, tags=["healthcheck"])
+    router.include_router(metrics.router, tags=["metrics"])
+    router.include_router(debug.router, prefix="/debug", tags=["debug"])
+    return router
@@ -1,11 +1,10 @@
-from typing import Any, Generic, TypeVar
 from datetime import datetime
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
 from book_api.domain.entities import Book
 
-
 TData = TypeVar("TData")
 TListItem = TypeVar("TListItem")
 
@@ -13,7 +12,9 @@ TListItem = TypeVar("TListItem")
 class PaginationOutSchema(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class ListPaginatedResponse(BaseModel, Generic[TListItem]):
@@ -53,3 +54,27 @@ class BookUpdateSchema(BaseModel):
     title: str | None = Field(default=None, min_length=1, max_length=255)
     author: str | None = Field(default=None, min_length=1, max_length=255)
     year: int | None = Field(default=None, gt=0, le=9999)
+
+
+class BookBulkUpdateItemSchema(BookUpdateSchema):
+    id: int
+
+
+class BookBulkDeleteSchema(BaseModel):
+    ids: list[int] = Field(..., min_length=1)
+
+
+class BulkItemErrorSchema(BaseModel):
+    index: int | None = None
+    id: int | None = None
+    detail: Any
+
+
+class BulkDeleteOutSchema(BaseModel):
+    deleted_ids: list[int]
+
+
+class ImportReportOutSchema(BaseModel):
+    imported: int
+    failed: int
+    chunks: int
@@ -1,20 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from book_api.presentation.api.v1.schemas import (
-    ApiResponse,
-    BookInSchema,
-    BookOutSchema,
-    BookUpdateSchema,
-    ListPaginatedResponse,
-    PaginationOutSchema,
-)
-from book_api.presentation.api.v1.dependencies import (
-    get_create_book_use_case,
-    get_delete_book_use_case,
-    get_get_book_use_case,
-    get_list_book_use_case,
-    get_update_book_use_case,
-)
 from book_api.application.commands import (
     BookSearchQuery,
     CreateBookCommand,
@@ -24,7 +11,6 @@ from book_api.application.commands import (
     PaginationQuery,
     UpdateBookCommand,
 )
-from book_api.domain.errors import BookNotFound
 from book_api.application.use_cases import (
     CreateBookUseCase,
     DeleteBookUseCase,
@@ -32,13 +18,60 @@ from book_api.application.use_cases import (
     GetBookUseCase,
     UpdateBookUseCase,
 )
-
+from book_api.domain.entities import BookPage
+from book_api.domain.errors import BookNotFound
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.models import build_match_expression
+from book_api.helpers.cursor import decode_cursor, encode_cursor
+from book_api.helpers.etag import book_etag, etag_matches, page_etag
+from book_api.presentation.api.v1.dependencies import (
+    get_create_book_use_case,
+    get_delete_book_use_case,
+    get_fast_json,
+    get_get_book_use_case,
+    get_list_book_use_case,
+    get_update_book_use_case,
+    get_write_generation,
+)
+from book_api.presentation.api.v1.responses import book_payload, fast_response
+from book_api.presentation.api.v1.schemas import (
+    ApiResponse,
+    BookInSchema,
+    BookOutSchema,
+    BookUpdateSchema,
+    ListPaginatedResponse,
+    PaginationOutSchema,
+)
 
 router = APIRouter()
 
+MAX_PAGE_LIMIT = 1000
+
+
+def get_pagination(
+    page: int = Query(default=0, ge=0),
+    limit: int = Query(default=10, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> PaginationQuery:
+    if cursor is None:
+        return PaginationQuery(page=page, limit=limit, include_total=include_total)
+    try:
+        after_id = decode_cursor(cursor)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from error
+    return PaginationQuery(
+        page=page, limit=limit, after_id=after_id, include_total=include_total
+    )
 
-def get_pagination(page: int = 0, limit: int = 10) -> PaginationQuery:
-    return PaginationQuery(page=page, limit=limit)
+
+def search_match_expression(q: str | None) -> str | None:
+    match_expression = build_match_expression(q)
+    if q and match_expression is None:
+        raise HTTPException(
+            status_code=400, detail="Search query has no searchable words"
+        )
+    return match_expression
 
 
 def get_all_books_command(
@@ -51,68 +84,158 @@ def get_search_command(
     title: str | None = Query(default=None),
     author: str | None = Query(default=None),
     year: int | None = Query(default=None),
+    q: str | None = Query(
+        default=None,
+        description="Full-text query over title and author, ranked by BM25",
+    ),
     pagination: PaginationQuery = Depends(get_pagination),
 ) -> GetBookListCommand:
+    if search_match_expression(q) and pagination.after_id is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported for full-text search",
+        )
     return GetBookListCommand(
-        search=BookSearchQuery(title=title, author=author, year=year),
+        search=BookSearchQuery(title=title, author=author, year=year, text=q),
         pagination=pagination,
     )
 
 
-@router.get("/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]])
-def get_all_books_view(
-    command: GetBookListCommand = Depends(get_all_books_command),
-    use_case: GetBookListUseCase = Depends(get_list_book_use_case),
-) -> ApiResponse[ListPaginatedResponse[BookOutSchema]]:
-    books, count = use_case.execute(command)
-    response = ListPaginatedResponse(
-        items=[BookOutSchema.from_entity(book) for book in books],
+def next_page_cursor(command: GetBookListCommand, page: BookPage) -> str | None:
+    if not command.search.text and page.has_more and page.items:
+        return encode_cursor(page.items[-1].id)
+    return None
+
+
+def build_list_response(
+    command: GetBookListCommand, page: BookPage
+) -> ListPaginatedResponse[BookOutSchema]:
+    return ListPaginatedResponse(
+        items=[BookOutSchema.from_entity(book) for book in page.items],
         pagination=PaginationOutSchema(
             page=command.pagination.page,
             limit=command.pagination.limit,
-            total=count,
+            total=page.total,
+            has_more=page.has_more,
+            next_cursor=next_page_cursor(command, page),
         ),
     )
-    return ApiResponse(data=response)
 
 
-@router.post("/", response_model=ApiResponse[BookOutSchema], status_code=status.HTTP_201_CREATED)
+def build_list_payload(command: GetBookListCommand, page: BookPage) -> dict[str, Any]:
+    return {
+        "items": [book_payload(book) for book in page.items],
+        "pagination": {
+            "page": command.pagination.page,
+            "limit": command.pagination.limit,
+            "total": page.total,
+            "has_more": page.has_more,
+            "next_cursor": next_page_cursor(command, page),
+        },
+    }
+
+
+def conditional_response(
+    response: Response, etag: str, if_none_match: str | None
+) -> Response | None:
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return None
+
+
+@router.get("/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]])
+def get_all_books_view(
+    response: Response,
+    command: GetBookListCommand = Depends(get_all_books_command),
+    if_none_match: str | None = Header(default=None),
+    use_case: GetBookListUseCase = Depends(get_list_book_use_case),
+    generation: WriteGeneration = Depends(get_write_generation),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[ListPaginatedResponse[BookOutSchema]] | Response:
+    current_generation = generation.value
+    page = use_case.execute(command)
+    etag = page_etag(
+        page,
+        current_generation,
+        command.pagination.page,
+        command.pagination.limit,
+        bool(command.search.text),
+    )
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(build_list_payload(command, page), response)
+    return ApiResponse(data=build_list_response(command, page))
+
+
+@router.post(
+    "/", response_model=ApiResponse[BookOutSchema], status_code=status.HTTP_201_CREATED
+)
 def create_book_view(
     payload: BookInSchema,
+    response: Response,
     use_case: CreateBookUseCase = Depends(get_create_book_use_case),
-) -> ApiResponse[BookOutSchema]:
-    command = CreateBookCommand(title=payload.title, author=payload.author, year=payload.year)
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
+    command = CreateBookCommand(
+        title=payload.title, author=payload.author, year=payload.year
+    )
     book = use_case.execute(command)
+    if fast_json:
+        return fast_response(book_payload(book), response, status.HTTP_201_CREATED)
     return ApiResponse(data=BookOutSchema.from_entity(book))
 
 
-@router.get("/search/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]])
+@router.get(
+    "/search/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]]
+)
 def search_books_view(
+    response: Response,
     command: GetBookListCommand = Depends(get_search_command),
+    if_none_match: str | None = Header(default=None),
     use_case: GetBookListUseCase = Depends(get_list_book_use_case),
-) -> ApiResponse[ListPaginatedResponse[BookOutSchema]]:
-    books, count = use_case.execute(command)
-    response = ListPaginatedResponse(
-        items=[BookOutSchema.from_entity(book) for book in books],
-        pagination=PaginationOutSchema(
-            page=command.pagination.page,
-            limit=command.pagination.limit,
-            total=count,
-        ),
+    generation: WriteGeneration = Depends(get_write_generation),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[ListPaginatedResponse[BookOutSchema]] | Response:
+    current_generation = generation.value
+    page = use_case.execute(command)
+    etag = page_etag(
+        page,
+        current_generation,
+        command.pagination.page,
+        command.pagination.limit,
+        bool(command.search.text),
     )
-    return ApiResponse(data=response)
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(build_list_payload(command, page), response)
+    return ApiResponse(data=build_list_response(command, page))
 
 
 @router.get("/{book_id}", response_model=ApiResponse[BookOutSchema])
 def get_book_view(
     book_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     use_case: GetBookUseCase = Depends(get_get_book_use_case),
-) -> ApiResponse[BookOutSchema]:
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
     command = GetBookCommand(book_id=book_id)
     try:
         book = use_case.execute(command)
     except BookNotFound as error:
         raise HTTPException(status_code=404, detail="Book not found") from error
+    not_modified = conditional_response(response, book_etag(book), if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(book_payload(book), response)
     return ApiResponse(data=BookOutSchema.from_entity(book))
 
 
@@ -120,13 +243,19 @@ def get_book_view(
 def update_book_view(
     book_id: int,
     payload: BookUpdateSchema,
+    response: Response,
     use_case: UpdateBookUseCase = Depends(get_update_book_use_case),
-) -> ApiResponse[BookOutSchema]:
-    command = UpdateBookCommand(book_id=book_id, title=payload.title, author=payload.author, year=payload.year)
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
+    command = UpdateBookCommand(
+        book_id=book_id, title=payload.title, author=payload.author, year=payload.year
+    )
     try:
         book = use_case.execute(command)
     except BookNotFound as error:
         raise HTTPException(status_code=404, detail="Book not found") from error
+    if fast_json:
+        return fast_response(book_payload(book), response)
     return ApiResponse(data=BookOutSchema.from_entity(book))
 
 
@@ -0,0 +1,171 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from book_api.application.commands import (
+    CreateBookCommand,
+    DeleteBookCommand,
+    GetBookCommand,
+    GetBookListCommand,
+    UpdateBookCommand,
+)
+from book_api.application.use_cases import (
+    AsyncCreateBookUseCase,
+    AsyncDeleteBookUseCase,
+    AsyncGetBookListUseCase,
+    AsyncGetBookUseCase,
+    AsyncUpdateBookUseCase,
+)
+from book_api.domain.errors import BookNotFound
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.helpers.etag import book_etag, page_etag
+from book_api.presentation.api.v1.dependencies import (
+    get_async_create_book_use_case,
+    get_async_delete_book_use_case,
+    get_async_get_book_use_case,
+    get_async_list_book_use_case,
+    get_async_update_book_use_case,
+    get_fast_json,
+    get_write_generation,
+)
+from book_api.presentation.api.v1.responses import book_payload, fast_response
+from book_api.presentation.api.v1.schemas import (
+    ApiResponse,
+    BookInSchema,
+    BookOutSchema,
+    BookUpdateSchema,
+    ListPaginatedResponse,
+)
+from book_api.presentation.api.v1.views.books import (
+    build_list_payload,
+    build_list_response,
+    conditional_response,
+    get_all_books_command,
+    get_search_command,
+)
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]])
+async def get_all_books_view(
+    response: Response,
+    command: GetBookListCommand = Depends(get_all_books_command),
+    if_none_match: str | None = Header(default=None),
+    use_case: AsyncGetBookListUseCase = Depends(get_async_list_book_use_case),
+    generation: WriteGeneration = Depends(get_write_generation),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[ListPaginatedResponse[BookOutSchema]] | Response:
+    current_generation = generation.value
+    page = await use_case.execute(command)
+    etag = page_etag(
+        page,
+        current_generation,
+        command.pagination.page,
+        command.pagination.limit,
+        bool(command.search.text),
+    )
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(build_list_payload(command, page), response)
+    return ApiResponse(data=build_list_response(command, page))
+
+
+@router.post(
+    "/", response_model=ApiResponse[BookOutSchema], status_code=status.HTTP_201_CREATED
+)
+async def create_book_view(
+    payload: BookInSchema,
+    response: Response,
+    use_case: AsyncCreateBookUseCase = Depends(get_async_create_book_use_case),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
+    command = CreateBookCommand(
+        title=payload.title, author=payload.author, year=payload.year
+    )
+    book = await use_case.execute(command)
+    if fast_json:
+        return fast_response(book_payload(book), response, status.HTTP_201_CREATED)
+    return ApiResponse(data=BookOutSchema.from_entity(book))
+
+
+@router.get(
+    "/search/", response_model=ApiResponse[ListPaginatedResponse[BookOutSchema]]
+)
+async def search_books_view(
+    response: Response,
+    command: GetBookListCommand = Depends(get_search_command),
+    if_none_match: str | None = Header(default=None),
+    use_case: AsyncGetBookListUseCase = Depends(get_async_list_book_use_case),
+    generation: WriteGeneration = Depends(get_write_generation),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[ListPaginatedResponse[BookOutSchema]] | Response:
+    current_generation = generation.value
+    page = await use_case.execute(command)
+    etag = page_etag(
+        page,
+        current_generation,
+        command.pagination.page,
+        command.pagination.limit,
+        bool(command.search.text),
+    )
+    not_modified = conditional_response(response, etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(build_list_payload(command, page), response)
+    return ApiResponse(data=build_list_response(command, page))
+
+
+@router.get("/{book_id}", response_model=ApiResponse[BookOutSchema])
+async def get_book_view(
+    book_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    use_case: AsyncGetBookUseCase = Depends(get_async_get_book_use_case),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
+    command = GetBookCommand(book_id=book_id)
+    try:
+        book = await use_case.execute(command)
+    except BookNotFound as error:
+        raise HTTPException(status_code=404, detail="Book not found") from error
+    not_modified = conditional_response(response, book_etag(book), if_none_match)
+    if not_modified is not None:
+        return not_modified
+    if fast_json:
+        return fast_response(book_payload(book), response)
+    return ApiResponse(data=BookOutSchema.from_entity(book))
+
+
+@router.put("/{book_id}", response_model=ApiResponse[BookOutSchema])
+async def update_book_view(
+    book_id: int,
+    payload: BookUpdateSchema,
+    response: Response,
+    use_case: AsyncUpdateBookUseCase = Depends(get_async_update_book_use_case),
+    fast_json: bool = Depends(get_fast_json),
+) -> ApiResponse[BookOutSchema] | Response:
+    command = UpdateBookCommand(
+        book_id=book_id, title=payload.title, author=payload.author, year=payload.year
+    )
+    try:
+        book = await use_case.execute(command)
+    except BookNotFound as error:
+        raise HTTPException(status_code=404, detail="Book not found") from error
+    if fast_json:
+        return fast_response(book_payload(book), response)
+    return ApiResponse(data=BookOutSchema.from_entity(book))
+
+
+@router.delete("/{book_id}", response_model=ApiResponse[dict])
+async def delete_book_view(
+    book_id: int,
+    use_case: AsyncDeleteBookUseCase = Depends(get_async_delete_book_use_case),
+) -> ApiResponse[dict]:
+    command = DeleteBookCommand(book_id=book_id)
+    try:
+        await use_case.execute(command)
+    except BookNotFound as error:
+        raise HTTPException(status_code=404, detail="Book not found") from error
+    return ApiResponse(data={})
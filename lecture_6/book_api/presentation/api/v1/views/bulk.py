@@ -0,0 +1,112 @@
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, status
+from pydantic import BaseModel, ValidationError
+
+from book_api.application.commands import (
+    BulkCreateBooksCommand,
+    BulkDeleteBooksCommand,
+    BulkUpdateBooksCommand,
+    CreateBookCommand,
+    UpdateBookCommand,
+)
+from book_api.application.use_cases import (
+    BulkCreateBooksUseCase,
+    BulkDeleteBooksUseCase,
+    BulkUpdateBooksUseCase,
+)
+from book_api.presentation.api.v1.dependencies import (
+    get_bulk_create_books_use_case,
+    get_bulk_delete_books_use_case,
+    get_bulk_update_books_use_case,
+)
+from book_api.presentation.api.v1.schemas import (
+    ApiResponse,
+    BookBulkDeleteSchema,
+    BookBulkUpdateItemSchema,
+    BookInSchema,
+    BookOutSchema,
+    BulkDeleteOutSchema,
+    BulkItemErrorSchema,
+)
+
+router = APIRouter()
+
+
+def validate_items(
+    items: list[Any], schema: type[BaseModel]
+) -> tuple[list[BaseModel], list[BulkItemErrorSchema]]:
+    valid: list[BaseModel] = []
+    errors: list[BulkItemErrorSchema] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append(schema.model_validate(item))
+        except ValidationError as error:
+            errors.append(
+                BulkItemErrorSchema(
+                    index=index,
+                    detail=error.errors(include_url=False, include_context=False),
+                )
+            )
+    return valid, errors
+
+
+@router.post(
+    "/bulk",
+    response_model=ApiResponse[list[BookOutSchema]],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_books_view(
+    payload: list[dict[str, Any]] = Body(..., min_length=1),
+    use_case: BulkCreateBooksUseCase = Depends(get_bulk_create_books_use_case),
+) -> ApiResponse[list[BookOutSchema]]:
+    items, errors = validate_items(payload, BookInSchema)
+    command = BulkCreateBooksCommand(
+        items=[
+            CreateBookCommand(title=item.title, author=item.author, year=item.year)
+            for item in items
+        ]
+    )
+    books = use_case.execute(command)
+    return ApiResponse(
+        data=[BookOutSchema.from_entity(book) for book in books], errors=errors
+    )
+
+
+@router.patch("/bulk", response_model=ApiResponse[list[BookOutSchema]])
+def bulk_update_books_view(
+    payload: list[dict[str, Any]] = Body(..., min_length=1),
+    use_case: BulkUpdateBooksUseCase = Depends(get_bulk_update_books_use_case),
+) -> ApiResponse[list[BookOutSchema]]:
+    items, errors = validate_items(payload, BookBulkUpdateItemSchema)
+    command = BulkUpdateBooksCommand(
+        items=[
+            UpdateBookCommand(
+                book_id=item.id, title=item.title, author=item.author, year=item.year
+            )
+            for item in items
+        ]
+    )
+    books, missing_ids = use_case.execute(command)
+    errors.extend(
+        BulkItemErrorSchema(id=book_id, detail="Book not found")
+        for book_id in missing_ids
+    )
+    return ApiResponse(
+        data=[BookOutSchema.from_entity(book) for book in books], errors=errors
+    )
+
+
+@router.delete("/bulk", response_model=ApiResponse[BulkDeleteOutSchema])
+def bulk_delete_books_view(
+    payload: BookBulkDeleteSchema,
+    use_case: BulkDeleteBooksUseCase = Depends(get_bulk_delete_books_use_case),
+) -> ApiResponse[BulkDeleteOutSchema]:
+    deleted_ids, missing_ids = use_case.execute(
+        BulkDeleteBooksCommand(book_ids=payload.ids)
+    )
+    errors = [
+        BulkItemErrorSchema(id=book_id, detail="Book not found")
+        for book_id in missing_ids
+    ]
+    return ApiResponse(data=BulkDeleteOutSchema(deleted_ids=deleted_ids), errors=errors)
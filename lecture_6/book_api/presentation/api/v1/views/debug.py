@@ -0,0 +1,33 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+
+from book_api.application.services.cached import BookCache
+from book_api.gateways.sqlite.slow_queries import SlowQueryLog
+from book_api.gateways.sqlite.statement_cache import StatementCacheStats
+from book_api.presentation.api.v1.dependencies import (
+    get_book_cache,
+    get_slow_query_log,
+    get_statement_cache_stats,
+)
+
+router = APIRouter()
+
+
+@router.get("/cache")
+def cache_stats_view(
+    cache: BookCache = Depends(get_book_cache),
+    statements: StatementCacheStats = Depends(get_statement_cache_stats),
+) -> dict[str, Any]:
+    return {"books": cache.snapshot(), "statements": statements.snapshot()}
+
+
+@router.get("/queries")
+def slow_queries_view(
+    limit: int = Query(20, ge=1, le=200),
+    slow_queries: SlowQueryLog = Depends(get_slow_query_log),
+) -> dict[str, Any]:
+    return {
+        "threshold_ms": slow_queries.threshold * 1000,
+        "statements": slow_queries.top(limit),
+    }
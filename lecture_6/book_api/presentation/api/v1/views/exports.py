@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from book_api.application.commands import BookSearchQuery, ExportBooksCommand
+from book_api.application.use_cases import ExportBooksUseCase
+from book_api.domain.entities import Book
+from book_api.presentation.api.v1.dependencies import get_export_books_use_case
+from book_api.presentation.api.v1.views.books import search_match_expression
+
+router = APIRouter()
+
+EXPORT_FIELDS = ("id", "title", "author", "year")
+EXPORT_CHUNK_ROWS = 500
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def iter_ndjson(books: Iterable[Book]) -> Iterator[str]:
+    lines: list[str] = []
+    for book in books:
+        lines.append(
+            json.dumps(
+                {
+                    "id": book.id,
+                    "title": book.title,
+                    "author": book.author,
+                    "year": book.year,
+                }
+            )
+        )
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(books: Iterable[Book]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    rows = 0
+    for book in books:
+        writer.writerow((book.id, book.title, book.author, book.year))
+        rows += 1
+        if rows >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue()
+
+
+def get_export_command(
+    title: str | None = Query(default=None),
+    author: str | None = Query(default=None),
+    year: int | None = Query(default=None),
+    q: str | None = Query(default=None),
+    batch_size: int = Query(default=1000, gt=0, le=10_000),
+) -> ExportBooksCommand:
+    search_match_expression(q)
+    return ExportBooksCommand(
+        search=BookSearchQuery(title=title, author=author, year=year, text=q),
+        batch_size=batch_size,
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_books_view(
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    command: ExportBooksCommand = Depends(get_export_command),
+    use_case: ExportBooksUseCase = Depends(get_export_books_use_case),
+) -> StreamingResponse:
+    books = use_case.execute(command)
+    chunks = iter_csv(books) if format == "csv" else iter_ndjson(books)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="books.{format}"'},
+    )
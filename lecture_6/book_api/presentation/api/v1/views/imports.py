@@ -0,0 +1,54 @@
+import io
+import tempfile
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from book_api.application.use_cases import BulkCreateBooksUseCase
+from book_api.core.configs import settings
+from book_api.presentation.api.v1.dependencies import get_bulk_create_books_use_case
+from book_api.presentation.api.v1.schemas import ApiResponse, ImportReportOutSchema
+from book_api.presentation.importing import ImportFormat, import_books
+
+router = APIRouter()
+
+
+@router.post(
+    "/import",
+    response_model=ApiResponse[ImportReportOutSchema],
+    description=(
+        "Imports UTF-8 NDJSON or CSV in chunks, each committed in its own transaction. "
+        "Rows that are malformed, invalid or not valid UTF-8 are reported as errors "
+        "and skipped; chunks committed before a failure stay committed."
+    ),
+)
+async def import_books_view(
+    request: Request,
+    format: ImportFormat = Query(default="ndjson"),
+    chunk_size: int = Query(default=settings.BOOK_IMPORT_CHUNK_SIZE, gt=0, le=50_000),
+    use_case: BulkCreateBooksUseCase = Depends(get_bulk_create_books_use_case),
+) -> ApiResponse[ImportReportOutSchema]:
+    with tempfile.TemporaryFile() as upload:
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.write, chunk)
+        upload.seek(0)
+        lines = io.TextIOWrapper(
+            upload, encoding="utf-8", errors="surrogateescape", newline=""
+        )
+        report = await run_in_threadpool(
+            import_books,
+            lines,
+            format,
+            use_case,
+            chunk_size=chunk_size,
+            max_errors=settings.BOOK_IMPORT_MAX_REPORTED_ERRORS,
+        )
+        lines.detach()
+
+    return ApiResponse(
+        data=ImportReportOutSchema(
+            imported=report.imported, failed=report.failed, chunks=report.chunks
+        ),
+        errors=[asdict(error) for error in report.errors],
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from book_api.gateways.sqlite.metrics import DatabaseMetrics
+from book_api.helpers.metrics import render_metrics
+from book_api.presentation.api.metrics import HttpMetrics
+from book_api.presentation.api.v1.dependencies import (
+    get_database_metrics,
+    get_http_metrics,
+)
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_view(
+    http_metrics: HttpMetrics | None = Depends(get_http_metrics),
+    database_metrics: list[DatabaseMetrics] = Depends(get_database_metrics),
+) -> PlainTextResponse:
+    metrics = [*(http_metrics.collect() if http_metrics is not None else ())]
+    for database in database_metrics:
+        metrics.extend(database.collect())
+    return PlainTextResponse(
+        render_metrics(metrics), media_type=PROMETHEUS_CONTENT_TYPE
+    )
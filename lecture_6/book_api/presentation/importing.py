@@ -0,0 +1,144 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from pydantic import TypeAdapter, ValidationError
+
+from book_api.application.commands import BulkCreateBooksCommand, CreateBookCommand
+from book_api.application.use_cases import BulkCreateBooksUseCase
+from book_api.presentation.api.v1.schemas import BookInSchema
+
+ImportFormat = Literal["ndjson", "csv"]
+
+_books_adapter = TypeAdapter(list[BookInSchema])
+
+
+@dataclass
+class ImportRowError:
+    line: int
+    detail: Any
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    failed: int = 0
+    chunks: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+
+UNDECODABLE_LINE = "Line is not valid UTF-8"
+
+
+def has_undecodable_bytes(text: str) -> bool:
+    # Uploads are decoded with surrogateescape, so bytes that are not UTF-8 survive as lone
+    # surrogates and fail the row instead of the whole import.
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def iter_ndjson_records(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        if has_undecodable_bytes(line):
+            yield line_number, ValueError(UNDECODABLE_LINE)
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as error:
+            yield line_number, error
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(lines)
+    for record in reader:
+        if any(
+            isinstance(value, str) and has_undecodable_bytes(value)
+            for value in record.values()
+        ):
+            yield reader.line_num, ValueError(UNDECODABLE_LINE)
+            continue
+        if record.get("year") == "":
+            record["year"] = None
+        yield reader.line_num, record
+
+
+def iter_records(lines: Iterable[str], fmt: ImportFormat) -> Iterator[tuple[int, Any]]:
+    return iter_csv_records(lines) if fmt == "csv" else iter_ndjson_records(lines)
+
+
+def validate_chunk(
+    records: list[tuple[int, Any]],
+) -> tuple[list[BookInSchema], list[ImportRowError]]:
+    errors = [
+        ImportRowError(line=line, detail=str(record))
+        for line, record in records
+        if isinstance(record, Exception)
+    ]
+    candidates = [
+        (line, record) for line, record in records if not isinstance(record, Exception)
+    ]
+    try:
+        return _books_adapter.validate_python(
+            [record for _, record in candidates]
+        ), errors
+    except ValidationError as error:
+        details: dict[int, list] = {}
+        for item in error.errors(include_url=False, include_context=False):
+            details.setdefault(item["loc"][0], []).append(
+                {**item, "loc": item["loc"][1:]}
+            )
+
+    errors.extend(
+        ImportRowError(line=candidates[index][0], detail=detail)
+        for index, detail in details.items()
+    )
+    valid = [
+        record for index, (_, record) in enumerate(candidates) if index not in details
+    ]
+    return _books_adapter.validate_python(valid), sorted(
+        errors, key=lambda row_error: row_error.line
+    )
+
+
+def import_books(
+    lines: Iterable[str],
+    fmt: ImportFormat,
+    use_case: BulkCreateBooksUseCase,
+    *,
+    chunk_size: int,
+    max_errors: int = 1000,
+) -> ImportReport:
+    report = ImportReport()
+
+    def flush(records: list[tuple[int, Any]]) -> None:
+        books, errors = validate_chunk(records)
+        if books:
+            command = BulkCreateBooksCommand(
+                items=[
+                    CreateBookCommand(
+                        title=book.title, author=book.author, year=book.year
+                    )
+                    for book in books
+                ]
+            )
+            report.imported += len(use_case.execute(command))
+            report.chunks += 1
+        report.failed += len(errors)
+        report.errors.extend(errors[: max(max_errors - len(report.errors), 0)])
+
+    chunk: list[tuple[int, Any]] = []
+    for record in iter_records(lines, fmt):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+    return report
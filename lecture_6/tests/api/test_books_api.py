@@ -1,3 +1,15 @@
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy import event
+
+from book_api.application.commands import CreateBookCommand
+from book_api.application.services.book import BookService
+from book_api.application.use_cases import CreateBookUseCase
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.group_commit import GroupCommitTimeout
 from tests.mocks.factories import BookInSchemaFactory
 
 
@@ -104,3 +116,517 @@ class TestBooksAPI:
         data = response.json()["data"]
         assert len(data["items"]) <= 2
         assert data["pagination"]["limit"] == 2
+
+    def test_cursor_pagination(self, client):
+        created_ids = []
+        for _ in range(5):
+            book_data = BookInSchemaFactory.build().model_dump()
+            created_ids.append(
+                client.post("/books/", json=book_data).json()["data"]["id"]
+            )
+
+        first_page = client.get("/books/", params={"limit": 2}).json()["data"]
+        cursor = first_page["pagination"]["next_cursor"]
+        assert cursor is not None
+
+        seen_ids = [item["id"] for item in first_page["items"]]
+        while cursor:
+            page = client.get("/books/", params={"limit": 2, "cursor": cursor}).json()[
+                "data"
+            ]
+            seen_ids.extend(item["id"] for item in page["items"])
+            cursor = page["pagination"]["next_cursor"]
+
+        assert seen_ids == sorted(created_ids)
+
+    def test_cursor_pagination_on_search(self, client):
+        author = BookInSchemaFactory.build().author
+        for _ in range(3):
+            client.post(
+                "/books/", json=BookInSchemaFactory.build(author=author).model_dump()
+            )
+
+        first_page = client.get(
+            "/books/search/", params={"author": author, "limit": 2}
+        ).json()["data"]
+        cursor = first_page["pagination"]["next_cursor"]
+        second_page = client.get(
+            "/books/search/", params={"author": author, "limit": 2, "cursor": cursor}
+        ).json()["data"]
+
+        assert len(second_page["items"]) == 1
+        assert second_page["items"][0]["id"] > first_page["items"][-1]["id"]
+        assert second_page["pagination"]["next_cursor"] is None
+
+    def test_pagination_rejects_out_of_range_parameters(self, client):
+        for params in (
+            {"limit": 0},
+            {"limit": -1},
+            {"limit": 1001},
+            {"page": -1},
+        ):
+            for path in ("/books/", "/books/search/"):
+                assert client.get(path, params=params).status_code == 422
+
+    def test_invalid_cursor(self, client):
+        response = client.get("/books/", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    def test_full_text_search_prefix(self, client):
+        client.post(
+            "/books/",
+            json={
+                "title": "Distributed Systems Primer",
+                "author": "Ada Byron",
+                "year": 2001,
+            },
+        )
+        client.post(
+            "/books/",
+            json={"title": "Cooking Basics", "author": "Julia Childs", "year": 1999},
+        )
+
+        response = client.get("/books/search/", params={"q": "distrib"})
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [item["title"] for item in data["items"]] == [
+            "Distributed Systems Primer"
+        ]
+        assert data["pagination"]["total"] == 1
+        assert data["pagination"]["next_cursor"] is None
+
+    def test_full_text_search_ranks_best_match_first(self, client):
+        client.post(
+            "/books/",
+            json={"title": "Python Tricks", "author": "Dan Bader", "year": 2017},
+        )
+        client.post(
+            "/books/",
+            json={
+                "title": "Python Python Python",
+                "author": "Monty Python",
+                "year": 1975,
+            },
+        )
+
+        response = client.get("/books/search/", params={"q": "python"})
+
+        items = response.json()["data"]["items"]
+        assert items[0]["title"] == "Python Python Python"
+
+    def test_full_text_search_follows_update_and_delete(self, client):
+        create_response = client.post(
+            "/books/", json={"title": "Old Name", "author": "Some Author", "year": 2000}
+        )
+        book_id = create_response.json()["data"]["id"]
+
+        client.put(f"/books/{book_id}", json={"title": "Fresh Name"})
+        assert (
+            client.get("/books/search/", params={"q": "old"}).json()["data"]["items"]
+            == []
+        )
+        assert (
+            len(
+                client.get("/books/search/", params={"q": "fresh"}).json()["data"][
+                    "items"
+                ]
+            )
+            == 1
+        )
+
+        client.delete(f"/books/{book_id}")
+        assert (
+            client.get("/books/search/", params={"q": "fresh"}).json()["data"]["items"]
+            == []
+        )
+
+    def test_full_text_search_rejects_cursor(self, client):
+        response = client.get(
+            "/books/search/", params={"q": "python", "cursor": "eyJpZCI6MX0"}
+        )
+
+        assert response.status_code == 400
+
+    def test_full_text_search_rejects_query_without_words(self, client):
+        client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        for path in ("/books/search/", "/books/export"):
+            response = client.get(path, params={"q": "!!!"})
+            assert response.status_code == 400
+        response = client.get(
+            "/books/search/", params={"q": "!!!", "cursor": "eyJpZCI6MX0"}
+        )
+        assert response.json()["detail"] == "Search query has no searchable words"
+
+    def test_pagination_without_total(self, client):
+        for _ in range(3):
+            client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        response = client.get("/books/", params={"limit": 2, "include_total": False})
+
+        pagination = response.json()["data"]["pagination"]
+        assert pagination["total"] is None
+        assert pagination["has_more"] is True
+
+    def test_bulk_create_books_reports_invalid_items(self, client):
+        valid = [BookInSchemaFactory.build().model_dump() for _ in range(3)]
+        payload = [valid[0], {"title": "", "author": "Nobody"}, valid[1], valid[2]]
+
+        response = client.post("/books/bulk", json=payload)
+
+        assert response.status_code == 201
+        body = response.json()
+        assert [item["title"] for item in body["data"]] == [
+            book["title"] for book in valid
+        ]
+        assert [error["index"] for error in body["errors"]] == [1]
+
+    def test_bulk_update_books_reports_missing_ids(self, client):
+        created = client.post(
+            "/books/bulk",
+            json=[BookInSchemaFactory.build().model_dump() for _ in range(2)],
+        )
+        first_id, second_id = (book["id"] for book in created.json()["data"])
+
+        response = client.patch(
+            "/books/bulk",
+            json=[
+                {"id": first_id, "title": "Renamed"},
+                {"id": second_id, "year": 1984},
+                {"id": 99999, "title": "Ghost"},
+            ],
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert {book["id"]: book["title"] for book in body["data"]}[
+            first_id
+        ] == "Renamed"
+        assert {book["id"]: book["year"] for book in body["data"]}[second_id] == 1984
+        assert body["errors"] == [
+            {"index": None, "id": 99999, "detail": "Book not found"}
+        ]
+
+    def test_bulk_delete_books(self, client):
+        created = client.post(
+            "/books/bulk",
+            json=[BookInSchemaFactory.build().model_dump() for _ in range(2)],
+        )
+        ids = [book["id"] for book in created.json()["data"]]
+
+        response = client.request("DELETE", "/books/bulk", json={"ids": [*ids, 99999]})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert sorted(body["data"]["deleted_ids"]) == sorted(ids)
+        assert [error["id"] for error in body["errors"]] == [99999]
+        assert all(
+            client.get(f"/books/{book_id}").status_code == 404 for book_id in ids
+        )
+
+    def test_cache_stats(self, client):
+        response = client.get("/debug/cache")
+
+        assert response.status_code == 200
+        assert {"hits", "misses", "evictions", "size"} <= response.json()[
+            "books"
+        ].keys()
+        assert {"hits", "misses", "uncached", "hit_ratio"} <= response.json()[
+            "statements"
+        ].keys()
+
+    def test_slow_queries_view(self, client, test_container):
+        slow_queries = test_container.resolve(Database).slow_queries
+        slow_queries.record("SELECT 1", (), 0.25, lambda: ("SCAN books",))
+
+        response = client.get("/debug/queries", params={"limit": 5})
+
+        assert response.status_code == 200
+        assert response.json()["statements"][0] == {
+            "statement": "SELECT 1",
+            "count": 1,
+            "total_ms": 250.0,
+            "mean_ms": 250.0,
+            "max_ms": 250.0,
+            "last_parameters": "()",
+            "plan": ["SCAN books"],
+        }
+
+    def test_metrics_exposes_route_latency_and_statement_timings(self, client):
+        book_id = client.post(
+            "/books/", json=BookInSchemaFactory.build().model_dump()
+        ).json()["data"]["id"]
+        client.get(f"/books/{book_id}")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'book_api_http_request_duration_seconds_count{method="GET",route="/books/{book_id}",status="200"} 1'
+            in response.text
+        )
+        assert "book_api_http_requests_in_flight 1" in response.text
+        assert 'book_api_threadpool_threads{state="total"}' in response.text
+        assert (
+            'book_api_db_statement_duration_seconds_count{pool="writer",statement="INSERT"}'
+            in response.text
+        )
+
+    def test_get_book_not_modified(self, client):
+        book_id = client.post(
+            "/books/", json=BookInSchemaFactory.build().model_dump()
+        ).json()["data"]["id"]
+        etag = client.get(f"/books/{book_id}").headers["ETag"]
+
+        response = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+        client.put(f"/books/{book_id}", json={"title": "Another Title"})
+        response = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_list_books_not_modified_until_write(self, client):
+        client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+        etag = client.get("/books/").headers["ETag"]
+
+        assert client.get("/books/", headers={"If-None-Match": etag}).status_code == 304
+        assert (
+            client.get(
+                "/books/", params={"limit": 1}, headers={"If-None-Match": etag}
+            ).status_code
+            == 200
+        )
+
+        client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        assert client.get("/books/", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_export_books_as_ndjson(self, client):
+        client.post(
+            "/books/bulk",
+            json=[
+                {"title": f"Export {index}", "author": "Exporter", "year": 2000}
+                for index in range(3)
+            ],
+        )
+        client.post(
+            "/books/",
+            json={"title": "Unrelated", "author": "Someone Else", "year": 1990},
+        )
+
+        response = client.get(
+            "/books/export", params={"format": "ndjson", "author": "Exporter"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == ["Export 0", "Export 1", "Export 2"]
+
+    def test_export_books_as_csv(self, client):
+        client.post(
+            "/books/",
+            json={"title": "Comma, Title", "author": 'Quoted "Author"', "year": 2001},
+        )
+
+        response = client.get("/books/export", params={"format": "csv", "q": "comma"})
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert rows == [
+            {
+                "id": rows[0]["id"],
+                "title": "Comma, Title",
+                "author": 'Quoted "Author"',
+                "year": "2001",
+            }
+        ]
+
+    def test_import_books_from_ndjson_in_chunks(self, client):
+        lines = [
+            json.dumps(
+                {"title": f"Imported {index}", "author": "Importer", "year": 2010}
+            )
+            for index in range(5)
+        ]
+        lines.insert(2, "{not json")
+        lines.insert(4, json.dumps({"title": "", "author": "Importer"}))
+        body = "\n".join(lines) + "\n"
+
+        response = client.post(
+            "/books/import", params={"format": "ndjson", "chunk_size": 2}, content=body
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["data"] == {"imported": 5, "failed": 2, "chunks": 4}
+        assert [error["line"] for error in payload["errors"]] == [3, 5]
+        assert (
+            client.get("/books/search/", params={"author": "Importer"}).json()["data"][
+                "pagination"
+            ]["total"]
+            == 5
+        )
+
+    def test_import_books_from_csv(self, client):
+        body = "title,author,year\nFirst,CSV Author,1999\nSecond,CSV Author,\n"
+
+        response = client.post("/books/import", params={"format": "csv"}, content=body)
+
+        assert response.json()["data"]["imported"] == 2
+        items = client.get("/books/search/", params={"author": "CSV Author"}).json()[
+            "data"
+        ]["items"]
+        assert [(item["title"], item["year"]) for item in items] == [
+            ("First", 1999),
+            ("Second", None),
+        ]
+
+    def test_import_reports_lines_that_are_not_utf8(self, client):
+        body = "title,author,year\nFirst,Latin Author,1999\nCafé,Latin Author,2000\n"
+
+        response = client.post(
+            "/books/import",
+            params={"format": "csv", "chunk_size": 1},
+            content=body.encode("latin-1"),
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["data"] == {"imported": 1, "failed": 1, "chunks": 1}
+        assert payload["errors"] == [{"line": 3, "detail": "Line is not valid UTF-8"}]
+
+    def test_import_ndjson_skips_lines_that_are_not_utf8(self, client):
+        lines = [
+            json.dumps({"title": "Café", "author": "NDJSON", "year": 2000}),
+            json.dumps({"title": "Cafe", "author": "NDJSON", "year": 2000}),
+        ]
+        body = "\n".join(lines).encode("utf-8").replace(b"\\u00e9", b"\xe9")
+
+        response = client.post("/books/import", content=body)
+
+        assert response.json()["data"] == {"imported": 1, "failed": 1, "chunks": 1}
+        assert response.json()["errors"][0]["line"] == 1
+
+
+class TestFastJsonAPI:
+    def test_list_response_matches_standard_mode(self, client, fast_client):
+        for _ in range(3):
+            client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        standard = client.get("/books/", params={"limit": 2})
+        fast = fast_client.get("/books/", params={"limit": 2})
+
+        assert fast.status_code == 200
+        assert fast.json() == standard.json()
+        assert fast.headers["etag"] == standard.headers["etag"]
+
+    def test_single_book_responses_match_standard_mode(self, client, fast_client):
+        created = fast_client.post(
+            "/books/", json=BookInSchemaFactory.build().model_dump()
+        )
+        book_id = created.json()["data"]["id"]
+
+        assert created.status_code == 201
+        assert (
+            fast_client.get(f"/books/{book_id}").json()
+            == client.get(f"/books/{book_id}").json()
+        )
+        updated = fast_client.put(f"/books/{book_id}", json={"title": "Fast Title"})
+        assert updated.json() == {
+            "data": {**created.json()["data"], "title": "Fast Title"},
+            "meta": {},
+            "errors": [],
+        }
+
+    def test_not_modified_in_fast_mode(self, fast_client):
+        book_id = fast_client.post(
+            "/books/", json=BookInSchemaFactory.build().model_dump()
+        ).json()["data"]["id"]
+        etag = fast_client.get(f"/books/{book_id}").headers["etag"]
+
+        response = fast_client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+
+class TestUnitOfWork:
+    def test_list_request_runs_in_one_read_transaction(self, client, test_container):
+        for _ in range(3):
+            client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+        engine = test_container.resolve(Database).engine
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        event.listen(engine, "before_cursor_execute", record)
+        # Past the last page the total needs a second, fallback count query.
+        response = client.get("/books/", params={"page": 5, "limit": 2})
+        event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()["data"]["pagination"]["total"] == 3
+        assert statements == ["BEGIN", "SELECT", "SELECT"]
+
+    def test_write_request_takes_the_write_lock_up_front(self, client, test_container):
+        book_id = client.post(
+            "/books/", json=BookInSchemaFactory.build().model_dump()
+        ).json()["data"]["id"]
+        engine = test_container.resolve(Database).engine
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        response = client.put(f"/books/{book_id}", json={"title": "Locked"})
+        event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert statements[0] == "BEGIN IMMEDIATE"
+
+    def test_write_is_rolled_back_when_the_request_fails_after_it(
+        self, client, test_container
+    ):
+        book_service = test_container.resolve(BookService)
+        generation = book_service.repository.generation.value
+
+        class CreateTwiceThenFail(CreateBookUseCase):
+            def execute(self, command: CreateBookCommand):
+                self.book_service.create(command.title, command.author, command.year)
+                self.book_service.create(command.title, command.author, command.year)
+                raise RuntimeError("failed after the writes")
+
+        test_container.register(
+            CreateBookUseCase, instance=CreateTwiceThenFail(book_service=book_service)
+        )
+
+        with pytest.raises(RuntimeError):
+            client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        assert client.get("/books/").json()["data"]["pagination"]["total"] == 0
+        assert book_service.repository.generation.value == generation
+
+    def test_group_commit_timeout_is_a_503(self, client, test_container):
+        book_service = test_container.resolve(BookService)
+
+        class TimedOutCreateBookUseCase(CreateBookUseCase):
+            def execute(self, command: CreateBookCommand):
+                raise GroupCommitTimeout("Write was not committed within 30s")
+
+        test_container.register(
+            CreateBookUseCase,
+            instance=TimedOutCreateBookUseCase(book_service=book_service),
+        )
+
+        response = client.post("/books/", json=BookInSchemaFactory.build().model_dump())
+
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Write was not committed within 30s"}
@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy import event
+
+from book_api.gateways.sqlite.database import AsyncDatabase
+from tests.mocks.factories import BookInSchemaFactory
+
+
+@pytest.fixture
+def file_async_database(test_container, tmp_path):
+    db = AsyncDatabase(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'books.db'}", slow_query_threshold=0
+    )
+    test_container.register(AsyncDatabase, instance=db)
+    return db
+
+
+class TestAsyncBooksAPI:
+    async def test_create_and_get_book(self, async_client):
+        book_data = BookInSchemaFactory.build().model_dump()
+        create_response = await async_client.post("/books/", json=book_data)
+
+        assert create_response.status_code == 201
+        book_id = create_response.json()["data"]["id"]
+
+        response = await async_client.get(f"/books/{book_id}")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["title"] == book_data["title"]
+
+    async def test_get_book_not_found(self, async_client):
+        response = await async_client.get("/books/99999")
+
+        assert response.status_code == 404
+
+    async def test_update_and_delete_book(self, async_client):
+        book_data = BookInSchemaFactory.build().model_dump()
+        book_id = (await async_client.post("/books/", json=book_data)).json()["data"][
+            "id"
+        ]
+
+        update_response = await async_client.put(
+            f"/books/{book_id}", json={"title": "Async Title"}
+        )
+        assert update_response.json()["data"]["title"] == "Async Title"
+
+        delete_response = await async_client.delete(f"/books/{book_id}")
+        assert delete_response.status_code == 200
+        assert (await async_client.get(f"/books/{book_id}")).status_code == 404
+
+    async def test_list_and_search_books(self, async_client):
+        for _ in range(3):
+            await async_client.post(
+                "/books/", json=BookInSchemaFactory.build().model_dump()
+            )
+        await async_client.post(
+            "/books/",
+            json={
+                "title": "Asynchronous Patterns",
+                "author": "Ann Author",
+                "year": 2020,
+            },
+        )
+
+        list_response = await async_client.get("/books/", params={"limit": 2})
+        pagination = list_response.json()["data"]["pagination"]
+        assert pagination["total"] == 4
+        assert pagination["next_cursor"] is not None
+
+        search_response = await async_client.get(
+            "/books/search/", params={"q": "asynch"}
+        )
+        assert [item["title"] for item in search_response.json()["data"]["items"]] == [
+            "Asynchronous Patterns"
+        ]
+
+    async def test_get_book_not_modified(self, async_client):
+        book_data = BookInSchemaFactory.build().model_dump()
+        book_id = (await async_client.post("/books/", json=book_data)).json()["data"][
+            "id"
+        ]
+        etag = (await async_client.get(f"/books/{book_id}")).headers["ETag"]
+
+        response = await async_client.get(
+            f"/books/{book_id}", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+
+    async def test_metrics_emit_each_family_once(self, async_client):
+        book = (
+            await async_client.post(
+                "/books/", json=BookInSchemaFactory.build().model_dump()
+            )
+        ).json()["data"]
+        await async_client.get(f"/books/{book['id']}")
+
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == 200
+        type_lines = [
+            line for line in response.text.splitlines() if line.startswith("# TYPE ")
+        ]
+        assert len(type_lines) == len(set(type_lines))
+        assert (
+            'book_api_db_statement_duration_seconds_count{pool="async",statement="INSERT"}'
+            in response.text
+        )
+
+    async def test_file_database_reuses_pooled_connections(
+        self, file_async_database, async_client
+    ):
+        connects = []
+        event.listen(
+            file_async_database.engine.sync_engine,
+            "connect",
+            lambda *args: connects.append(args),
+        )
+        book = (
+            await async_client.post(
+                "/books/", json=BookInSchemaFactory.build().model_dump()
+            )
+        ).json()["data"]
+
+        for _ in range(20):
+            response = await async_client.get(f"/books/{book['id']}")
+            assert response.status_code == 200
+
+        assert len(connects) <= 1
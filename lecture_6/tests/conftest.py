@@ -1,54 +1,121 @@
 import punq
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from book_api.domain.services import IBookService
+from book_api.application.services.book import AsyncBookService, BookService
+from book_api.application.services.cached import BookCache, CachedBookService
 from book_api.application.use_cases import (
+    AsyncCreateBookUseCase,
+    AsyncDeleteBookUseCase,
+    AsyncGetBookListUseCase,
+    AsyncGetBookUseCase,
+    AsyncUpdateBookUseCase,
+    BulkCreateBooksUseCase,
+    BulkDeleteBooksUseCase,
+    BulkUpdateBooksUseCase,
     CreateBookUseCase,
     DeleteBookUseCase,
+    ExportBooksUseCase,
     GetBookListUseCase,
     GetBookUseCase,
     UpdateBookUseCase,
 )
-from book_api.gateways.sqlite.database import Database
+from book_api.domain.services import IAsyncBookService, IBookService
+from book_api.gateways.sqlite.async_repositories import (
+    AsyncSQLiteBookRepository,
+    IAsyncBookRepository,
+)
+from book_api.gateways.sqlite.caching import CountCache, WriteGeneration
+from book_api.gateways.sqlite.database import AsyncDatabase, Database
+from book_api.gateways.sqlite.metrics import DatabaseMetrics, install_database_metrics
 from book_api.gateways.sqlite.models import BaseORM
 from book_api.gateways.sqlite.repositories import IBookRepository, SQLiteBookRepository
-from book_api.application.services.book import BookService
-from tests.mocks.services import DummyBookService
+from book_api.gateways.sqlite.slow_queries import SlowQueryLog
+from book_api.gateways.sqlite.statement_cache import (
+    StatementCacheStats,
+    install_statement_cache_stats,
+)
 from book_api.main import web_app_factory
 from book_api.presentation.api.v1.dependencies import get_container
+from tests.mocks.services import DummyBookService
 
 
 def create_test_database() -> Database:
     db = Database.__new__(Database)
+    db.url = "sqlite:///:memory:"
     db.engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    db._session_factory = sessionmaker(bind=db.engine, autocommit=False, autoflush=False)
+    db.statement_cache_stats = StatementCacheStats()
+    install_statement_cache_stats(db.engine, db.statement_cache_stats)
+    db.metrics = DatabaseMetrics()
+    install_database_metrics(db.engine, db.metrics, "writer")
+    db.slow_queries = SlowQueryLog(threshold=0)
+    db._session_factory = sessionmaker(
+        bind=db.engine, autocommit=False, autoflush=False
+    )
+    db.read_engine = db.engine
+    db._read_session_factory = db._session_factory
     db._tables_created = False
     BaseORM.metadata.create_all(bind=db.engine)
     db._tables_created = True
     return db
 
 
+def create_test_async_database() -> AsyncDatabase:
+    db = AsyncDatabase.__new__(AsyncDatabase)
+    db.engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+    )
+    db.statement_cache_stats = StatementCacheStats()
+    install_statement_cache_stats(db.engine.sync_engine, db.statement_cache_stats)
+    db.metrics = DatabaseMetrics()
+    install_database_metrics(db.engine.sync_engine, db.metrics, "async")
+    db.slow_queries = SlowQueryLog(threshold=0)
+    db._session_factory = async_sessionmaker(
+        bind=db.engine, autoflush=False, expire_on_commit=False
+    )
+    db._tables_created = False
+    return db
+
+
 def create_test_container() -> punq.Container:
     container = punq.Container()
 
     test_db = create_test_database()
     container.register(Database, instance=test_db)
+    container.register(WriteGeneration, instance=WriteGeneration())
+    container.register(CountCache, instance=CountCache())
 
     container.register(IBookRepository, SQLiteBookRepository)
+    container.register(BookService)
+    container.register(BookCache, instance=BookCache(max_size=100, ttl=60.0))
     container.register(IBookService, BookService)
     container.register(GetBookListUseCase)
+    container.register(ExportBooksUseCase)
     container.register(GetBookUseCase)
     container.register(CreateBookUseCase)
     container.register(UpdateBookUseCase)
     container.register(DeleteBookUseCase)
+    container.register(BulkCreateBooksUseCase)
+    container.register(BulkUpdateBooksUseCase)
+    container.register(BulkDeleteBooksUseCase)
+
+    container.register(AsyncDatabase, instance=create_test_async_database())
+    container.register(IAsyncBookRepository, AsyncSQLiteBookRepository)
+    container.register(IAsyncBookService, AsyncBookService)
+    container.register(AsyncGetBookListUseCase)
+    container.register(AsyncGetBookUseCase)
+    container.register(AsyncCreateBookUseCase)
+    container.register(AsyncUpdateBookUseCase)
+    container.register(AsyncDeleteBookUseCase)
 
     return container
 
@@ -58,6 +125,13 @@ def test_container() -> punq.Container:
     return create_test_container()
 
 
+@pytest.fixture
+def cached_test_container() -> punq.Container:
+    container = create_test_container()
+    container.register(IBookService, CachedBookService)
+    return container
+
+
 @pytest.fixture
 def mock_test_container() -> punq.Container:
     container = create_test_container()
@@ -77,3 +151,36 @@ def client(test_container):
 
     app.dependency_overrides.clear()  # type: ignore[union-attr]
     get_container.cache_clear()
+
+
+@pytest.fixture
+def fast_client(test_container):
+    get_container.cache_clear()
+
+    app = web_app_factory(fast_json=True)
+    app.dependency_overrides[get_container] = lambda: test_container  # type: ignore[index]
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()  # type: ignore[union-attr]
+    get_container.cache_clear()
+
+
+@pytest.fixture
+async def async_client(test_container):
+    get_container.cache_clear()
+    async_db = test_container.resolve(AsyncDatabase)
+    await async_db.create_tables()
+
+    app = web_app_factory(io_mode="async")
+    app.dependency_overrides[get_container] = lambda: test_container  # type: ignore[index]
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()  # type: ignore[union-attr]
+    await async_db.close()
+    get_container.cache_clear()
@@ -0,0 +1,194 @@
+import pytest
+from sqlalchemy import event
+
+from book_api.domain.entities import Book
+from book_api.domain.errors import InvalidSearchQuery, UnsupportedPagination
+from book_api.gateways.sqlite.queries import page_query
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+from tests.conftest import create_test_database
+
+
+@pytest.fixture
+def repository() -> SQLiteBookRepository:
+    repository = SQLiteBookRepository(database=create_test_database())
+    for index in range(5):
+        repository.create(title=f"Book {index}", author="Author", year=2000 + index)
+    return repository
+
+
+@pytest.fixture
+def statements(repository) -> list[str]:
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(repository.database.engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(repository.database.engine, "before_cursor_execute", record)
+
+
+def test_find_page_returns_page_and_total_in_one_statement(repository, statements):
+    page = repository.find_page(title=None, author=None, year=None, offset=2, limit=2)
+
+    assert [book.title for book in page.items] == ["Book 2", "Book 3"]
+    assert page.total == 5
+    assert page.has_more is True
+    assert len(statements) == 1
+
+
+def test_find_page_without_total_detects_last_page(repository, statements):
+    page = repository.find_page(
+        title=None, author=None, year=None, offset=4, limit=2, include_total=False
+    )
+
+    assert [book.title for book in page.items] == ["Book 4"]
+    assert page.total is None
+    assert page.has_more is False
+    assert len(statements) == 1
+
+
+def test_find_page_keyset_counts_whole_filter(repository):
+    first = repository.find_page(title=None, author=None, year=None, offset=0, limit=2)
+    second = repository.find_page(
+        title=None,
+        author=None,
+        year=None,
+        offset=0,
+        limit=2,
+        after_id=first.items[-1].id,
+    )
+
+    assert second.total == 5
+    assert second.items[0].id > first.items[-1].id
+
+
+def test_text_search_without_words_is_rejected(repository):
+    with pytest.raises(InvalidSearchQuery):
+        repository.find_page(
+            title=None, author=None, year=None, text="!!!", offset=0, limit=2
+        )
+
+
+def test_keyset_cursor_is_rejected_for_ranked_text_search(repository):
+    with pytest.raises(UnsupportedPagination):
+        repository.find_page(
+            title=None,
+            author=None,
+            year=None,
+            text="Book",
+            offset=0,
+            limit=2,
+            after_id=1,
+        )
+    with pytest.raises(UnsupportedPagination):
+        repository.find_many(
+            title=None,
+            author=None,
+            year=None,
+            text="Book",
+            offset=0,
+            limit=2,
+            after_id=1,
+        )
+
+
+def test_find_page_past_the_end_still_reports_total(repository):
+    page = repository.find_page(title=None, author=None, year=None, offset=50, limit=2)
+
+    assert page.items == []
+    assert page.total == 5
+    assert page.has_more is False
+
+
+def test_count_is_cached_until_next_write(repository, statements):
+    first = repository.find_page(title=None, author=None, year=None, offset=0, limit=2)
+    second = repository.find_page(title=None, author=None, year=None, offset=2, limit=2)
+    count = repository.count_many(title="", author=None, year=None)
+
+    assert first.total == second.total == count == 5
+    assert "over" in statements[0].lower()
+    assert "count" not in statements[1].lower()
+    assert len(statements) == 2
+
+    repository.create(title="Book 5", author="Author", year=2005)
+
+    assert repository.count_many(title=None, author=None, year=None) == 6
+
+
+def test_count_cache_keys_differ_per_filter(repository):
+    assert repository.count_many(title=None, author=None, year=2001) == 1
+    assert repository.count_many(title=None, author=None, year=None) == 5
+    repository.delete_many([1, 2])
+    assert repository.count_many(title=None, author=None, year=2001) == 0
+
+
+def test_read_path_builds_entities_from_rows(repository):
+    book = repository.get_by_id(2)
+    books = repository.find_many(title=None, author=None, year=2001, offset=0, limit=10)
+
+    assert book == Book(id=2, title="Book 1", author="Author", year=2001)
+    assert books == [book]
+    assert repository.get_by_id(999) is None
+
+
+def test_read_path_interns_authors(repository):
+    books = repository.find_many(
+        title=None, author="Author", year=None, offset=0, limit=10
+    )
+
+    assert len({id(book.author) for book in books}) == 1
+
+
+def test_update_and_delete_are_single_returning_statements(repository, statements):
+    updated = repository.update(1, title="Renamed", author=None, year=None)
+    missing = repository.update(999, title="Renamed", author=None, year=None)
+    deleted = repository.delete(1)
+
+    assert updated == Book(id=1, title="Renamed", author="Author", year=2000)
+    assert missing is None
+    assert deleted is True
+    assert repository.delete(1) is False
+    assert [statement.split()[0] for statement in statements] == [
+        "UPDATE",
+        "UPDATE",
+        "DELETE",
+        "DELETE",
+    ]
+    assert all("RETURNING" in statement for statement in statements)
+
+
+def test_create_reads_back_the_row_from_insert_returning(repository, statements):
+    book = repository.create(title="Fresh", author="Author", year=2024)
+    books = repository.create_many(
+        [
+            {"title": f"Batch {index}", "author": "Author", "year": None}
+            for index in range(3)
+        ]
+    )
+
+    assert book == Book(id=6, title="Fresh", author="Author", year=2024)
+    assert [item.id for item in books] == [7, 8, 9]
+    assert len(statements) == 2
+    assert all(
+        statement.startswith("INSERT") and "RETURNING" in statement
+        for statement in statements
+    )
+
+
+def test_filter_combinations_reuse_compiled_statements(repository):
+    first = page_query("Book", None, 2000, None, offset=0, limit=2, after_id=None)
+    second = page_query("Other", None, 1999, None, offset=4, limit=3, after_id=None)
+    repository.find_page(title="Book", author=None, year=1999, offset=0, limit=2)
+    before = repository.database.statement_cache_stats.snapshot()
+
+    for year in (2000, 2001, 2002):
+        repository.find_page(title="Book", author=None, year=year, offset=0, limit=2)
+
+    after = repository.database.statement_cache_stats.snapshot()
+    assert first.statement is second.statement
+    assert second.params == {"title": "%Other%", "year": 1999, "offset": 4, "limit": 3}
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (
+        3,
+        0,
+    )
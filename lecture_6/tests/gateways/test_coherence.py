@@ -0,0 +1,70 @@
+import pytest
+
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.coherence import DataVersionMonitor
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+from book_api.helpers.cache import LRUCache
+
+
+@pytest.fixture
+def url(tmp_path):
+    return f"sqlite:///{tmp_path / 'books.db'}"
+
+
+@pytest.fixture
+def databases(url):
+    # Two Database objects on one file stand in for two worker processes.
+    local, other = (
+        Database(url=url, pragmas={"journal_mode": "WAL"}),
+        Database(url=url, pragmas={}),
+    )
+    local.create_tables()
+    yield local, other
+    local.close()
+    other.close()
+
+
+def test_detects_commits_from_other_connections(databases, url):
+    _, other = databases
+    generation = WriteGeneration()
+    cache = LRUCache(max_size=10, ttl=60.0)
+    cache.set(1, "stale")
+    monitor = DataVersionMonitor(url=url, generation=generation, caches=(cache,))
+
+    assert monitor.sync() is False
+    SQLiteBookRepository(database=other, generation=WriteGeneration()).create(
+        title="T", author="A", year=None
+    )
+
+    assert monitor.sync() is True
+    assert generation.value == 1
+    assert len(cache) == 0
+    assert monitor.sync() is False
+    monitor.close()
+
+
+def test_interval_throttles_polling(databases, url):
+    _, other = databases
+    now = [0.0]
+    generation = WriteGeneration()
+    monitor = DataVersionMonitor(
+        url=url, generation=generation, interval=1.0, clock=lambda: now[0]
+    )
+    monitor.sync()
+
+    SQLiteBookRepository(database=other, generation=WriteGeneration()).create(
+        title="T", author="A", year=None
+    )
+    assert monitor.sync() is False
+
+    now[0] = 1.5
+    assert monitor.sync() is True
+    monitor.close()
+
+
+def test_in_memory_database_is_not_monitored():
+    monitor = DataVersionMonitor(url="sqlite:///:memory:", generation=WriteGeneration())
+
+    assert monitor.enabled is False
+    assert monitor.sync() is False
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+from book_api.gateways.sqlite.caching import CountCache
+from book_api.gateways.sqlite.database import AsyncDatabase, Database
+from book_api.gateways.sqlite.models import BookORM
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+
+
+def test_database_applies_performance_pragmas(tmp_path):
+    db = Database(
+        url=f"sqlite:///{tmp_path / 'books.db'}",
+        pragmas={
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -2000,
+            "temp_store": "MEMORY",
+            "busy_timeout": 1234,
+        },
+    )
+
+    pragmas = db.effective_pragmas()
+    db.close()
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "cache_size": -2000,
+        "temp_store": 2,
+        "busy_timeout": 1234,
+    }
+
+
+async def test_async_database_applies_performance_pragmas(tmp_path):
+    db = AsyncDatabase(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'books.db'}",
+        pragmas={"journal_mode": "WAL", "mmap_size": 1048576},
+    )
+
+    pragmas = await db.effective_pragmas()
+    await db.close()
+
+    assert pragmas == {"journal_mode": "wal", "mmap_size": 1048576}
+
+
+def test_unit_of_work_reads_from_one_snapshot(tmp_path):
+    db = Database(
+        url=f"sqlite:///{tmp_path / 'books.db'}", pragmas={"journal_mode": "WAL"}
+    )
+    db.create_tables()
+    repository = SQLiteBookRepository(database=db, count_cache=CountCache(max_size=0))
+    repository.create(title="First", author="Author", year=2000)
+
+    with db.unit_of_work() as unit_of_work:
+        before = repository.count_many(title=None, author=None, year=None)
+        with db.connection as other:
+            other.execute(
+                insert(BookORM).values(title="Second", author="Author", year=2001)
+            )
+            other.commit()
+        during = repository.count_many(title=None, author=None, year=None)
+        with repository.read_session as session:
+            assert session is unit_of_work.session
+
+    after = repository.count_many(title=None, author=None, year=None)
+    db.close()
+
+    assert (before, during, after) == (1, 1, 2)
+
+
+def test_reads_use_a_read_only_pool(tmp_path):
+    db = Database(
+        url=f"sqlite:///{tmp_path / 'books.db'}",
+        pragmas={"journal_mode": "WAL"},
+        read_only_pool=True,
+    )
+    db.create_tables()
+    repository = SQLiteBookRepository(database=db)
+    book = repository.create(title="First", author="Author", year=2000)
+
+    with db.read_engine.connect() as connection:
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(
+                insert(BookORM).values(title="Second", author="Author", year=2001)
+            )
+    assert db.read_engine is not db.engine
+    assert repository.get_by_id(book.id) == book
+    db.close()
+
+
+def test_memory_database_shares_one_engine():
+    db = Database(url="sqlite://", pragmas={}, read_only_pool=True)
+
+    assert db.read_engine is db.engine
+    db.close()
@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.group_commit import (
+    GroupCommitBookRepository,
+    GroupCommitTimeout,
+    GroupCommitWriter,
+    GroupCommitWriterStopped,
+)
+from book_api.gateways.sqlite.repositories import insert_book
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(
+        url=f"sqlite:///{tmp_path / 'books.db'}", pragmas={"journal_mode": "WAL"}
+    )
+    database.create_tables()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repository(database):
+    generation = WriteGeneration()
+    writer = GroupCommitWriter(
+        database=database, generation=generation, max_batch=16, max_delay=0.05
+    )
+    yield GroupCommitBookRepository(
+        database=database, generation=generation, writer=writer
+    )
+    writer.close()
+
+
+def test_concurrent_writes_share_commits(repository, database):
+    commits: list[object] = []
+
+    def record(conn):
+        commits.append(conn)
+
+    event.listen(database.engine, "commit", record)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        books = list(
+            pool.map(
+                lambda index: repository.create(
+                    title=f"Book {index}", author="Author", year=None
+                ),
+                range(32),
+            )
+        )
+    event.remove(database.engine, "commit", record)
+
+    assert len({book.id for book in books}) == 32
+    assert len(commits) < 32
+    assert repository.count_many(title=None, author=None, year=None) == 32
+
+
+def test_failed_write_does_not_abort_its_group(repository):
+    writer = repository.writer
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        broken = pool.submit(
+            writer.submit,
+            lambda connection: insert_book(
+                connection, title=None, author="A", year=None
+            ),
+        )
+        created = pool.submit(
+            repository.create, title="Kept", author="Author", year=2000
+        )
+
+    with pytest.raises(IntegrityError):
+        broken.result()
+    assert repository.get_by_id(created.result().id).title == "Kept"
+
+
+def test_update_and_delete_resolve_their_own_results(repository):
+    book = repository.create(title="Draft", author="Author", year=2000)
+
+    assert (
+        repository.update(book.id, title="Final", author=None, year=None).title
+        == "Final"
+    )
+    assert repository.update(999, title="Final", author=None, year=None) is None
+    assert repository.delete(book.id) is True
+    assert repository.delete(book.id) is False
+
+
+class WriterKilled(BaseException):
+    pass
+
+
+def test_writer_death_fails_pending_and_later_writes(database):
+    writer = GroupCommitWriter(
+        database=database, generation=WriteGeneration(), timeout=5.0
+    )
+
+    def kill(connection):
+        raise WriterKilled
+
+    with pytest.raises(GroupCommitWriterStopped):
+        writer.submit(kill)
+    with pytest.raises(GroupCommitWriterStopped):
+        writer.submit(
+            lambda connection: insert_book(
+                connection, title="Late", author="A", year=None
+            )
+        )
+    writer.close()
+
+
+def test_batch_without_committed_writes_keeps_the_generation(repository):
+    generation = repository.generation.value
+
+    with pytest.raises(IntegrityError):
+        repository.writer.submit(
+            lambda connection: insert_book(
+                connection, title=None, author="A", year=None
+            )
+        )
+    assert repository.generation.value == generation
+
+    repository.create(title="Kept", author="Author", year=2000)
+    assert repository.generation.value == generation + 1
+
+
+def test_slow_write_times_out_the_waiting_caller(database):
+    writer = GroupCommitWriter(
+        database=database, generation=WriteGeneration(), timeout=0.05
+    )
+    release = threading.Event()
+
+    with pytest.raises(GroupCommitTimeout):
+        writer.submit(lambda connection: release.wait(5))
+    release.set()
+    writer.close()
@@ -0,0 +1,30 @@
+from sqlalchemy import text
+
+from book_api.gateways.sqlite.caching import CountCache
+from book_api.gateways.sqlite.models import BOOKS_FTS_TABLE, build_match_expression
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+from tests.conftest import create_test_database
+
+
+def test_build_match_expression_quotes_prefix_terms():
+    assert build_match_expression('tolkien "lord') == '"tolkien"* "lord"*'
+    assert build_match_expression("  ?! ") is None
+    assert build_match_expression(None) is None
+
+
+def test_rebuild_search_index_restores_missing_rows():
+    db = create_test_database()
+    repository = SQLiteBookRepository(database=db, count_cache=CountCache(max_size=0))
+    repository.create(title="Dune", author="Frank Herbert", year=1965)
+
+    with db.engine.begin() as connection:
+        connection.execute(
+            text(
+                f"INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}) VALUES ('delete-all')"
+            )
+        )
+    assert repository.count_many(title=None, author=None, year=None, text="dune") == 0
+
+    db.rebuild_search_index()
+
+    assert repository.count_many(title=None, author=None, year=None, text="dune") == 1
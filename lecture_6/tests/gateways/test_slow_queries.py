@@ -0,0 +1,58 @@
+import logging
+
+import pytest
+
+from book_api.gateways.sqlite.caching import WriteGeneration
+from book_api.gateways.sqlite.database import Database
+from book_api.gateways.sqlite.repositories import SQLiteBookRepository
+from book_api.gateways.sqlite.slow_queries import SlowQueryLog, format_plan
+
+
+@pytest.fixture
+def database(tmp_path):
+    # A threshold this small treats every statement as slow.
+    database = Database(
+        url=f"sqlite:///{tmp_path / 'books.db'}", slow_query_threshold=1e-9
+    )
+    database.create_tables()
+    database.slow_queries.clear()
+    yield database
+    database.close()
+
+
+def test_slow_statements_are_logged_with_plan_once_per_shape(database, caplog):
+    repository = SQLiteBookRepository(database=database, generation=WriteGeneration())
+    repository.create(title="Dune", author="Frank Herbert", year=1965)
+
+    with caplog.at_level(
+        logging.WARNING, logger="book_api.gateways.sqlite.slow_queries"
+    ):
+        for _ in range(3):
+            repository.find_many(
+                title=None, author="Frank Herbert", year=None, offset=0, limit=10
+            )
+
+    statements = database.slow_queries.top()
+    search = next(
+        slow
+        for slow in statements
+        if "books.author" in slow["statement"] and "LIMIT" in slow["statement"]
+    )
+    assert search["count"] == 3
+    assert "Frank Herbert" in search["last_parameters"]
+    assert any(line.lstrip().startswith(("SEARCH", "SCAN")) for line in search["plan"])
+    assert "plan:" in caplog.text
+
+
+def test_log_keeps_the_most_expensive_statements():
+    slow_queries = SlowQueryLog(threshold=0.1, max_statements=2)
+    for statement, duration in (("A", 0.5), ("B", 0.2), ("C", 0.3)):
+        slow_queries.record(statement, (), duration, lambda: ())
+
+    assert [slow["statement"] for slow in slow_queries.top()] == ["A", "C"]
+
+
+def test_format_plan_indents_children():
+    rows = [(2, 0, 0, "SCAN books"), (5, 2, 0, "USE TEMP B-TREE FOR ORDER BY")]
+
+    assert format_plan(rows) == ("SCAN books", "  USE TEMP B-TREE FOR ORDER BY")
@@ -0,0 +1,63 @@
+from book_api.helpers.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2, ttl=60.0)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert cache.get(2) == (False, None)
+    assert cache.get(1) == (True, "a")
+    assert cache.stats.evictions == 1
+
+
+def test_lru_cache_expires_entries_and_uses_negative_ttl():
+    clock = FakeClock()
+    cache = LRUCache(max_size=10, ttl=10.0, negative_ttl=1.0, clock=clock)
+    cache.set("found", "value")
+    cache.set("missing", None)
+
+    clock.now = 2.0
+    assert cache.get("found") == (True, "value")
+    assert cache.get("missing") == (False, None)
+
+    clock.now = 11.0
+    assert cache.get("found") == (False, None)
+    assert cache.stats.expirations == 2
+
+
+def test_lru_cache_snapshot_reports_counters():
+    cache = LRUCache(max_size=10, ttl=10.0)
+    cache.set(1, "a")
+    cache.get(1)
+    cache.get(2)
+    cache.invalidate(1)
+
+    snapshot = cache.snapshot()
+
+    assert snapshot["hits"] == 1
+    assert snapshot["misses"] == 1
+    assert snapshot["invalidations"] == 1
+    assert snapshot["hit_ratio"] == 0.5
+    assert snapshot["size"] == 0
+
+
+def test_lru_cache_drops_sets_from_before_an_invalidation():
+    cache = LRUCache(max_size=10, ttl=60.0)
+    version = cache.version
+    cache.invalidate("other")
+    cache.set("key", "stale", version=version)
+
+    assert cache.get("key") == (False, None)
+    cache.set("key", "fresh", version=cache.version)
+    assert cache.get("key") == (True, "fresh")
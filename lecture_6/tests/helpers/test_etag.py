@@ -0,0 +1,28 @@
+from book_api.domain.entities import Book, BookPage
+from book_api.helpers.etag import book_etag, etag_matches, page_etag
+
+
+def test_etag_matches_lists_weak_and_wildcard():
+    etag = book_etag(Book(id=1, title="Dune", author="Frank Herbert", year=1965))
+
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_page_etag_changes_with_generation_and_contents():
+    page = BookPage(
+        items=[Book(id=1, title="Dune", author="Frank Herbert", year=1965)],
+        total=1,
+        has_more=False,
+    )
+    renamed = BookPage(
+        items=[Book(id=1, title="Dune II", author="Frank Herbert", year=1965)],
+        total=1,
+        has_more=False,
+    )
+
+    assert page_etag(page, 1) == page_etag(page, 1)
+    assert page_etag(page, 1) != page_etag(page, 2)
+    assert page_etag(page, 1) != page_etag(renamed, 1)
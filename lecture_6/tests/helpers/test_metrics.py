@@ -0,0 +1,24 @@
+from book_api.helpers.metrics import Gauge, Histogram, render_metrics
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/books/")
+    histogram.observe(0.5, "/books/")
+    histogram.observe(5.0, "/books/")
+
+    lines = list(histogram.render())
+
+    assert 'latency_seconds_bucket{route="/books/",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/books/",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/books/",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/books/"} 5.55' in lines
+    assert 'latency_seconds_count{route="/books/"} 3' in lines
+
+
+def test_gauge_escapes_label_values():
+    gauge = Gauge("things", "Things", ("name",))
+    gauge.inc(2, 'say "hi"\n')
+    gauge.dec(1, 'say "hi"\n')
+
+    assert 'things{name="say \\"hi\\"\\n"} 1' in render_metrics([gauge])
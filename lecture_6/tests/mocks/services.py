@@ -1,6 +1,8 @@
 import random
+from collections.abc import Iterator
+from typing import Any
 
-from book_api.domain.entities import Book
+from book_api.domain.entities import Book, BookPage
 from book_api.domain.services import IBookService
 from tests.mocks.factories import BookFactory
 
@@ -10,16 +12,78 @@ class DummyBookService(IBookService):
         return BookFactory.build(id=book_id)
 
     def create(self, title: str, author: str, year: int | None) -> Book:
-        return BookFactory.build(id=random.randint(1, 1000), title=title, author=author, year=year)
+        return BookFactory.build(
+            id=random.randint(1, 1000), title=title, author=author, year=year
+        )
 
-    def update(self, book_id: int, *, title: str | None, author: str | None, year: int | None) -> Book:
-        return BookFactory.build(id=book_id, title=title or "title", author=author or "author", year=year)
+    def update(
+        self, book_id: int, *, title: str | None, author: str | None, year: int | None
+    ) -> Book:
+        return BookFactory.build(
+            id=book_id, title=title or "title", author=author or "author", year=year
+        )
 
     def delete(self, book_id: int) -> None:
         return None
 
-    def find_many(self, *, offset: int, limit: int, title: str | None = None, author: str | None = None, year: int | None = None) -> list[Book]:
+    def find_many(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+    ) -> list[Book]:
         return [BookFactory.build(id=i) for i in range(limit)]
 
-    def count_many(self, *, title: str | None = None, author: str | None = None, year: int | None = None) -> int:
+    def count_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+    ) -> int:
         return random.randint(0, 100)
+
+    def find_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        after_id: int | None = None,
+        text: str | None = None,
+        include_total: bool = True,
+    ) -> BookPage:
+        items = [BookFactory.build(id=i) for i in range(limit)]
+        return BookPage(
+            items=items, total=limit if include_total else None, has_more=False
+        )
+
+    def iter_many(
+        self,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: int | None = None,
+        text: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Book]:
+        return iter([BookFactory.build(id=i) for i in range(3)])
+
+    def create_many(self, books: list[dict[str, Any]]) -> list[Book]:
+        return [
+            BookFactory.build(id=index + 1, **book) for index, book in enumerate(books)
+        ]
+
+    def update_many(self, changes: list[dict[str, Any]]) -> list[Book]:
+        return [BookFactory.build(**change) for change in changes]
+
+    def delete_many(self, book_ids: list[int]) -> list[int]:
+        return list(book_ids)
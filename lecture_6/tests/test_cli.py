@@ -0,0 +1,26 @@
+import json
+
+from book_api import cli
+from book_api.application.commands import BookSearchQuery, GetBookListCommand
+from book_api.application.use_cases import GetBookListUseCase
+
+
+def test_import_command_loads_file_in_chunks(
+    tmp_path, test_container, monkeypatch, capsys
+):
+    source = tmp_path / "books.ndjson"
+    source.write_text(
+        "\n".join(
+            json.dumps({"title": f"CLI {index}", "author": "Cli Author"})
+            for index in range(3)
+        )
+    )
+    monkeypatch.setattr(cli, "get_container", lambda: test_container)
+
+    cli.main(["import", str(source), "--chunk-size", "2"])
+
+    assert "Imported 3 books in 2 chunks, 0 rows failed" in capsys.readouterr().out
+    page = test_container.resolve(GetBookListUseCase).execute(
+        GetBookListCommand(search=BookSearchQuery(author="Cli Author"))
+    )
+    assert page.total == 3
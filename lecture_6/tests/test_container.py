@@ -0,0 +1,41 @@
+from book_api.application.services.cached import BookCache
+from book_api.application.use_cases import (
+    CreateBookUseCase,
+    GetBookListUseCase,
+    GetBookUseCase,
+)
+from book_api.core import container as container_module
+from book_api.core.container import get_container, init_container
+from book_api.gateways.sqlite.database import Database
+
+
+def test_preresolved_graph_reuses_instances():
+    container = init_container(preresolve_graph=True)
+
+    use_case = container.resolve(GetBookUseCase)
+
+    assert container.resolve(GetBookUseCase) is use_case
+    assert container.resolve(CreateBookUseCase).book_service is use_case.book_service
+    assert container.resolve(GetBookListUseCase).book_service is use_case.book_service
+    container.resolve(Database).close()
+
+
+def test_lazy_graph_builds_use_cases_per_resolve():
+    container = init_container(preresolve_graph=False)
+
+    use_case = container.resolve(GetBookUseCase)
+
+    assert container.resolve(GetBookUseCase) is not use_case
+    assert container.resolve(BookCache) is container.resolve(BookCache)
+    container.resolve(Database).close()
+
+
+def test_fork_hook_discards_inherited_container():
+    inherited = get_container()
+
+    container_module._reset_container_after_fork()
+
+    assert get_container.cache_info().currsize == 0
+    assert get_container() is not inherited
+    get_container().resolve(Database).close()
+    get_container.cache_clear()
@@ -1,12 +1,24 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from book_api.application.commands import (
+    BulkCreateBooksCommand,
+    BulkDeleteBooksCommand,
+    GetBookCommand,
+    UpdateBookCommand,
+)
+from book_api.application.services.cached import BookCache
 from book_api.application.use_cases import (
+    BulkCreateBooksUseCase,
+    BulkDeleteBooksUseCase,
     CreateBookUseCase,
     DeleteBookUseCase,
     GetBookListUseCase,
     GetBookUseCase,
     UpdateBookUseCase,
 )
+from book_api.domain.errors import BookNotFound
 from tests.mocks.factories import (
     BookSearchQueryFactory,
     CreateBookCommandFactory,
@@ -48,9 +60,9 @@ def test_get_book_list(mock_get_book_list_use_case):
         pagination=PaginationQueryFactory.build(),
         search=BookSearchQueryFactory.build(),
     )
-    books, _ = mock_get_book_list_use_case.execute(command)
+    page = mock_get_book_list_use_case.execute(command)
 
-    assert len(books) <= command.pagination.limit
+    assert len(page.items) <= command.pagination.limit
 
 
 def test_get_book_by_id(mock_get_book_use_case):
@@ -81,3 +93,80 @@ def test_delete_book(mock_delete_book_use_case):
     result = mock_delete_book_use_case.execute(command)
 
     assert result is None
+
+
+def test_bulk_delete_books_reports_missing(test_container):
+    create_use_case = test_container.resolve(BulkCreateBooksUseCase)
+    delete_use_case = test_container.resolve(BulkDeleteBooksUseCase)
+    books = create_use_case.execute(
+        BulkCreateBooksCommand(items=CreateBookCommandFactory.batch(3))
+    )
+
+    deleted_ids, missing_ids = delete_use_case.execute(
+        BulkDeleteBooksCommand(book_ids=[books[0].id, books[1].id, 99999])
+    )
+
+    assert deleted_ids == [books[0].id, books[1].id]
+    assert missing_ids == [99999]
+
+
+def test_cached_get_book_hits_cache_and_invalidates_on_update(cached_test_container):
+    cache = cached_test_container.resolve(BookCache)
+    create_use_case = cached_test_container.resolve(CreateBookUseCase)
+    get_use_case = cached_test_container.resolve(GetBookUseCase)
+    update_use_case = cached_test_container.resolve(UpdateBookUseCase)
+    book = create_use_case.execute(CreateBookCommandFactory.build())
+
+    get_use_case.execute(GetBookCommand(book_id=book.id))
+    get_use_case.execute(GetBookCommand(book_id=book.id))
+    assert cache.stats.hits == 1
+
+    update_use_case.execute(UpdateBookCommand(book_id=book.id, title="Changed"))
+
+    assert get_use_case.execute(GetBookCommand(book_id=book.id)).title == "Changed"
+
+
+def test_cached_get_book_does_not_store_a_row_invalidated_while_loading(
+    cached_test_container, monkeypatch
+):
+    cache = cached_test_container.resolve(BookCache)
+    book = cached_test_container.resolve(CreateBookUseCase).execute(
+        CreateBookCommandFactory.build()
+    )
+    get_use_case = cached_test_container.resolve(GetBookUseCase)
+    service = get_use_case.book_service.service
+    load = service.get_by_id
+
+    def load_then_concurrent_write(book_id):
+        loaded = load(book_id)
+        cache.invalidate(book_id)
+        return loaded
+
+    monkeypatch.setattr(service, "get_by_id", load_then_concurrent_write)
+    get_use_case.execute(GetBookCommand(book_id=book.id))
+
+    assert cache.get(book.id) == (False, None)
+
+
+def test_cached_book_cannot_be_mutated_by_a_caller(cached_test_container):
+    book = cached_test_container.resolve(CreateBookUseCase).execute(
+        CreateBookCommandFactory.build()
+    )
+    get_use_case = cached_test_container.resolve(GetBookUseCase)
+    cached = get_use_case.execute(GetBookCommand(book_id=book.id))
+
+    with pytest.raises(FrozenInstanceError):
+        cached.title = "Mutated"
+    assert get_use_case.execute(GetBookCommand(book_id=book.id)).title == book.title
+
+
+def test_cached_get_book_caches_misses(cached_test_container):
+    cache = cached_test_container.resolve(BookCache)
+    get_use_case = cached_test_container.resolve(GetBookUseCase)
+
+    for _ in range(2):
+        with pytest.raises(BookNotFound):
+            get_use_case.execute(GetBookCommand(book_id=99999))
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1